@@ -7,14 +7,19 @@ sys.path.insert(0, str(root_directory / "src"))
 import fabric_cicd.constants as constants
 
 
+BEGIN_MARKER = "<!--BEGIN-SUPPORTED-ITEM-TYPES-->\n"
+END_MARKER = "<!--END-SUPPORTED-ITEM-TYPES-->\n"
+
+# The item type list is the same for every page, so it is rendered once
+SUPPORTED_ITEM_TYPES_MARKDOWN = "\n".join(f"-   {item}" for item in constants.ACCEPTED_ITEM_TYPES)
+
+
 def on_page_markdown(markdown, **kwargs):
-    if "<!--BEGIN-SUPPORTED-ITEM-TYPES-->\n" in markdown:
-        start_index = markdown.index("<!--BEGIN-SUPPORTED-ITEM-TYPES-->\n") + len("<!--BEGIN-SUPPORTED-ITEM-TYPES-->\n")
-        end_index = markdown.index("<!--END-SUPPORTED-ITEM-TYPES-->\n")
+    begin_index = markdown.find(BEGIN_MARKER)
+    if begin_index == -1:
+        return markdown
 
-        supported_item_types = constants.ACCEPTED_ITEM_TYPES
-        markdown_content = "\n".join([f"-   {item}" for item in supported_item_types])
+    start_index = begin_index + len(BEGIN_MARKER)
+    end_index = markdown.index(END_MARKER)
 
-        new_markdown = markdown[:start_index] + markdown_content + markdown[end_index:]
-        return new_markdown
-    return markdown
+    return markdown[:start_index] + SUPPORTED_ITEM_TYPES_MARKDOWN + markdown[end_index:]
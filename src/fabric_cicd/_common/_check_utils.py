@@ -6,7 +6,9 @@
 import json
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import filetype
 import yaml
@@ -15,16 +17,20 @@ from fabric_cicd._common._exceptions import FileTypeError
 
 logger = logging.getLogger(__name__)
 
+# Safe YAML loader to parse with, backed by libyaml when PyYAML is built with libyaml
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def check_file_type(file_path: Path) -> str:
+
+def check_file_type(file_path: Path, file_bytes: Optional[bytes] = None) -> str:
     """
     Check the type of the provided file.
 
     Args:
         file_path: The path to the file.
+        file_bytes: The file contents, if already read. Avoids reading the file again.
     """
     try:
-        kind = filetype.guess(file_path)
+        kind = filetype.guess(file_path if file_bytes is None else file_bytes)
     except Exception as e:
         msg = f"Error determining file type of {file_path}: {e}"
         FileTypeError(msg, logger)
@@ -37,10 +43,13 @@ def check_file_type(file_path: Path) -> str:
     return "text"
 
 
+@lru_cache(maxsize=256)
 def check_regex(regex: str) -> re.Pattern:
     """
     Check if a regex pattern is valid and returns the pattern.
 
+    Compiled patterns are cached, as the same exclude regex is checked for every item and folder published.
+
     Args:
         regex: The regex pattern to match.
     """
@@ -80,7 +89,7 @@ def check_valid_yaml_content(content: str) -> bool:
         bool: True if the content parses as a YAML mapping or sequence, False otherwise.
     """
     try:
-        result = yaml.safe_load(content)
+        result = yaml.load(content, Loader=YAML_LOADER)
         return isinstance(result, (dict, list))
     except yaml.YAMLError:
         return False
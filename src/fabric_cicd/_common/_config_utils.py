@@ -40,10 +40,7 @@ def get_config_value(config_section: dict, key: str, environment: str) -> Option
     Returns:
         The extracted value, or None if key doesn't exist or environment not found in dict
     """
-    if key not in config_section:
-        return None
-
-    value = config_section[key]
+    value = config_section.get(key)
 
     if isinstance(value, dict):
         return value.get(environment)
@@ -108,9 +105,8 @@ def extract_publish_settings(config: dict, environment: str) -> dict:
     """Extract publish-specific settings from config for the given environment."""
     settings = {}
 
-    if "publish" in config:
-        publish_config = config["publish"]
-
+    publish_config = config.get("publish")
+    if publish_config is not None:
         # Optional settings - validation logs debug if value not found for target environment
         settings_to_update = [
             "exclude_regex",
@@ -132,9 +128,8 @@ def extract_unpublish_settings(config: dict, environment: str) -> dict:
     """Extract unpublish-specific settings from config for the given environment."""
     settings = {}
 
-    if "unpublish" in config:
-        unpublish_config = config["unpublish"]
-
+    unpublish_config = config.get("unpublish")
+    if unpublish_config is not None:
         # Optional settings - validation logs debug if value not found for target environment
         settings_to_update = [
             "exclude_regex",
@@ -168,17 +163,17 @@ def config_overrides_scope(config: dict, environment: str) -> Generator[None, No
 
     try:
         # Set feature flags
-        if "features" in config:
-            features = config["features"]
+        features = config.get("features")
+        if features is not None:
             features_list = features.get(environment, []) if isinstance(features, dict) else features
-            for feature in features_list:
-                constants.FEATURE_FLAG.add(feature)
-                logger.info(f"Enabled feature flag: {feature}")
+            if features_list:
+                constants.FEATURE_FLAG.update(features_list)
+                logger.info(f"Enabled feature flags: {', '.join(map(str, features_list))}")
 
         # Apply constants overrides
-        if "constants" in config:
-            constants_section = config["constants"]
-            for key in list(constants_section.keys()):
+        constants_section = config.get("constants")
+        if constants_section is not None:
+            for key in list(constants_section):
                 value = get_config_value(constants_section, key, environment)
                 if value is not None and hasattr(constants, key):
                     overridden_keys[key] = getattr(constants, key)
@@ -3,6 +3,7 @@
 
 """Configuration validation for YAML-based deployment configuration."""
 
+import json
 import logging
 import re
 from pathlib import Path
@@ -11,12 +12,47 @@ from typing import Any, Optional, Union
 import yaml
 
 from fabric_cicd import constants
+from fabric_cicd._common._check_utils import YAML_LOADER
 from fabric_cicd._common._exceptions import InputError
 from fabric_cicd._common._validate_env_vars import _URL_CONSTANTS, validate_api_url
 
 logger = logging.getLogger(__name__)
 
 
+def _load_yaml_file(config_path: Path) -> object:
+    """
+    Load a YAML (or JSON) file with the fastest available parser.
+
+    Args:
+        config_path: The resolved path of the YAML file.
+    """
+    # Read the whole file at once and decode it in a single call; invalid UTF-8 still raises UnicodeDecodeError
+    content = config_path.read_bytes().decode("utf-8")
+
+    config = None
+    parsed = False
+    if config_path.suffix.lower() == ".json":
+        # JSON is a subset of YAML, so a JSON config can skip the slower YAML parser; invalid JSON falls
+        # through to the YAML parser, which accepts the looser syntax and reports errors as before
+        try:
+            config = json.loads(content)
+            parsed = True
+        except ValueError:
+            pass
+
+    if not parsed:
+        try:
+            config = yaml.load(content, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            if YAML_LOADER is yaml.SafeLoader:
+                raise
+            # Parse the file again with the pure Python loader, whose errors include the file name and source snippet
+            with config_path.open(encoding="utf-8") as f:
+                config = yaml.safe_load(f)
+
+    return config
+
+
 class ConfigValidationError(InputError):
     """Specific exception for configuration validation errors."""
 
@@ -119,8 +155,7 @@ class ConfigValidator:
             return None
 
         try:
-            with config_path.open(encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = _load_yaml_file(config_path)
         except yaml.YAMLError as e:
             self.errors.append(constants.CONFIG_VALIDATION_MSGS["file"]["yaml_syntax"].format(e))
             return None
@@ -1094,4 +1129,4 @@ def _find_git_root(path: Path) -> Optional[Path]:
 
 def _validate_guid_format(guid: str) -> bool:
     """Validate GUID format using the pattern from constants."""
-    return bool(re.match(constants.VALID_GUID_REGEX, guid))
+    return bool(constants.VALID_GUID_PATTERN.match(guid))
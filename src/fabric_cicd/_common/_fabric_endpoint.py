@@ -7,6 +7,7 @@ import datetime
 import json
 import logging
 import os
+import threading
 import time
 from typing import Optional
 
@@ -15,6 +16,8 @@ from azure.core.credentials import TokenCredential
 from azure.core.exceptions import (
     ClientAuthenticationError,
 )
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
 
 import fabric_cicd.constants as constants
 from fabric_cicd._common._exceptions import InvokeError, TokenError
@@ -24,6 +27,11 @@ logger = logging.getLogger(__name__)
 
 _RESOURCE_URL = "https://api.fabric.microsoft.com/.default"
 _TOKEN_EXPIRY_BUFFER = datetime.timedelta(seconds=10)
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+_TRANSIENT_STATUS_CODES = frozenset({502, 503, 504})
+# Longest wait between the session's retries of a transient gateway error, including waits for Retry-After
+_TRANSIENT_RETRY_MAX_DELAY_SECONDS = 10
 
 
 class FabricEndpoint:
@@ -44,7 +52,8 @@ class FabricEndpoint:
             http_tracer: Optional HTTP tracer for debugging. If None, create using factory.
         """
         self.token_credential = token_credential
-        self.requests = requests_module
+        # Reuse connections across calls via a session unless a custom requests module is provided
+        self.requests = _get_shared_session() if requests_module is requests else requests_module
         self.http_tracer = http_tracer if http_tracer is not None else HTTPTracerFactory.create()
         self._token: Optional[str] = None
         self._token_expiry: Optional[datetime.datetime] = None
@@ -78,7 +87,9 @@ class FabricEndpoint:
         iteration_count = 0
         long_running = False
         start_time = time.time()
-        invoke_log_message = ""
+        # Arguments of the last request's log message. Formatting serializes the request and response bodies,
+        # so the message is only built when it is logged or attached to an error.
+        invoke_log_args = None
 
         while not exit_loop:
             try:
@@ -95,7 +106,7 @@ class FabricEndpoint:
 
                 iteration_count += 1
 
-                invoke_log_message = _format_invoke_log(response, method, url, body)
+                invoke_log_args = (response, method, url, body)
 
                 # Handle expired authentication token
                 if response.status_code == 401 and response.headers.get("x-ms-public-api-error-code") == "TokenExpired":
@@ -120,11 +131,12 @@ class FabricEndpoint:
 
                 # Log if reached to end of loop iteration
                 if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(invoke_log_message)
+                    logger.debug(_format_invoke_log(*invoke_log_args))
 
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
                 iteration_count += 1
                 if max_duration is not None and time.time() - start_time >= max_duration:
+                    invoke_log_message = _format_last_invoke_log(invoke_log_args)
                     logger.debug(invoke_log_message)
                     raise InvokeError(e, logger, invoke_log_message) from e
                 handle_retry(
@@ -136,6 +148,7 @@ class FabricEndpoint:
                 )
 
             except Exception as e:
+                invoke_log_message = _format_last_invoke_log(invoke_log_args)
                 logger.debug(invoke_log_message)
                 raise InvokeError(e, logger, invoke_log_message) from e
 
@@ -173,6 +186,61 @@ class FabricEndpoint:
             raise TokenError(msg, logger) from e
 
 
+def _get_shared_session() -> requests.Session:
+    """Returns the module-level session, so connections are pooled across all endpoint instances."""
+    global _SHARED_SESSION
+    # Endpoints can be created from publish worker threads, so only one of them may create the session
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            _SHARED_SESSION = _create_session()
+    return _SHARED_SESSION
+
+
+class _TransientRetry(Retry):
+    """
+    Retry configuration of the pooled session, waiting at most _TRANSIENT_RETRY_MAX_DELAY_SECONDS between retries.
+
+    The cap is applied by overriding the wait calculations, as the backoff_max argument is not available in urllib3 1.26.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Returns the exponential backoff time in seconds, capped at _TRANSIENT_RETRY_MAX_DELAY_SECONDS."""
+        return min(super().get_backoff_time(), _TRANSIENT_RETRY_MAX_DELAY_SECONDS)
+
+    def get_retry_after(self, response: HTTPResponse) -> Optional[float]:
+        """Returns the Retry-After header value in seconds, capped at _TRANSIENT_RETRY_MAX_DELAY_SECONDS."""
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, _TRANSIENT_RETRY_MAX_DELAY_SECONDS)
+
+
+def _create_session() -> requests.Session:
+    """
+    Creates a requests session that keeps connections alive across calls, with a connection pool
+    large enough for parallel publishing.
+
+    Transient gateway errors on idempotent requests, such as long-running operation polls, are retried
+    by the adapter with exponential backoff, waiting for the Retry-After header when the service sends one.
+    Waits are capped at _TRANSIENT_RETRY_MAX_DELAY_SECONDS, as they are not bounded by the max_duration of invoke.
+    Connection errors and throttling are left to the retry handling in invoke.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_maxsize=max(constants.PARALLEL_MAX_WORKERS, requests.adapters.DEFAULT_POOLSIZE),
+        max_retries=_TransientRetry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=2,
+            status_forcelist=_TRANSIENT_STATUS_CODES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _handle_response(
     response: requests.Response,
     method: str,
@@ -392,6 +460,23 @@ def handle_retry(
         raise Exception(msg)
 
 
+def _format_last_invoke_log(invoke_log_args: Optional[tuple]) -> str:
+    """
+    Format the log message of the last request for an error, or an empty string if there is none.
+
+    Args:
+        invoke_log_args: The response, method, url and body of the last request, or None.
+    """
+    if invoke_log_args is None:
+        return ""
+    try:
+        return _format_invoke_log(*invoke_log_args)
+    except Exception as e:
+        # Do not mask the original error if the response cannot be formatted
+        logger.debug(f"Unable to format invoke log message: {e}")
+        return ""
+
+
 def _format_invoke_log(response: requests.Response, method: str, url: str, body: str) -> str:
     """
     Format the log message for the invoke method.
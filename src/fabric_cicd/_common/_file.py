@@ -45,20 +45,24 @@ class File:
 
     def __post_init__(self) -> None:
         """After initializing the object, read the file contents and set the type."""
-        file_type = check_file_type(self.file_path)
+        # Read the file once and use the same bytes for both the file type check and the contents
+        try:
+            file_bytes = self.file_path.read_bytes()
+        except Exception as e:
+            msg = (
+                f"Error reading file {self.file_path}.  "
+                f"Please submit this as a bug https://github.com/microsoft/fabric-cicd/issues/new?template=1-bug.yml.md. Exception: {e}"
+            )
+            raise FileTypeError(msg, logger) from e
+        file_type = check_file_type(self.file_path, file_bytes)
 
         if file_type != "text":
-            try:
-                self.contents = self.file_path.read_bytes()
-            except Exception as e:
-                msg = (
-                    f"Error reading file {self.file_path} as binary.  "
-                    f"Please submit this as a bug https://github.com/microsoft/fabric-cicd/issues/new?template=1-bug.yml.md. Exception: {e}"
-                )
-                FileTypeError(msg, logger)
+            self.contents = file_bytes
         else:
             try:
-                self.contents = self.file_path.read_text(encoding="utf-8")
+                text = file_bytes.decode("utf-8")
+                # Translate newlines as read_text does (universal newlines mode)
+                self.contents = text.replace("\r\n", "\n").replace("\r", "\n") if "\r" in text else text
             except Exception as e:
                 msg = (
                     f"Error reading file {self.file_path} as text.  "
@@ -83,9 +87,13 @@ class File:
     def base64_payload(self) -> dict:
         """Return the file contents as a base64 encoded payload."""
         byte_file = self.contents.encode("utf-8") if self.type == "text" else self.contents
+        encoded_file = base64.b64encode(byte_file)
+        # Release the encoded text before decoding, so large files do not hold every intermediate copy at once
+        del byte_file
 
         return {
             "path": self.relative_path,
-            "payload": base64.b64encode(byte_file).decode("utf-8"),
+            # Base64 output is always ASCII, which decodes without the UTF-8 validation pass
+            "payload": encoded_file.decode("ascii"),
             "payloadType": "InlineBase64",
         }
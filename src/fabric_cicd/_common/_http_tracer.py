@@ -9,7 +9,7 @@ import json
 import logging
 import os
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Optional, Protocol
@@ -49,7 +49,18 @@ class HTTPRequest:
 
     def to_b64(self) -> str:
         """Serialize to base64-encoded JSON."""
-        request_json = json.dumps(asdict(self), separators=(",", ":"), default=_trace_default)
+        # Serialize the fields directly; asdict() would deep copy the (possibly large) body first
+        request_json = json.dumps(
+            {
+                "method": self.method,
+                "url": self.url,
+                "headers": self.headers,
+                "body": self.body,
+                "timestamp": self.timestamp,
+            },
+            separators=(",", ":"),
+            default=_trace_default,
+        )
         return base64.b64encode(request_json.encode()).decode()
 
     @classmethod
@@ -87,7 +98,12 @@ class HTTPResponse:
 
     def to_b64(self) -> str:
         """Serialize to base64-encoded JSON."""
-        response_json = json.dumps(asdict(self), separators=(",", ":"), default=_trace_default)
+        # Serialize the fields directly; asdict() would deep copy the (possibly large) body first
+        response_json = json.dumps(
+            {"status_code": self.status_code, "headers": self.headers, "body": self.body, "timestamp": self.timestamp},
+            separators=(",", ":"),
+            default=_trace_default,
+        )
         return base64.b64encode(response_json.encode()).decode()
 
     @classmethod
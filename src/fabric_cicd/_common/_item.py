@@ -4,9 +4,10 @@
 """Functions and classes to manage Item operations."""
 
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from fabric_cicd._common._file import File
 
@@ -45,10 +46,18 @@ class Item:
         """Return the relative path of the file."""
         return str(self.file_path.relative_to(self.item_path).as_posix())
 
-    def collect_item_files(self) -> None:
-        """Collect all files in the item path."""
+    def collect_item_files(self, exclude_path: Optional[str] = None) -> None:
+        """
+        Collect all files in the item path.
+
+        Args:
+            exclude_path: Regex string of relative paths to exclude. Excluded files are never read.
+        """
         self.item_files = []
+        exclude_pattern = re.compile(exclude_path) if exclude_path else None
         for root, _dirs, files in os.walk(self.path):
             for file in files:
                 full_path = Path(root, file)
+                if exclude_pattern and exclude_pattern.match(full_path.relative_to(self.path).as_posix()):
+                    continue
                 self.item_files.append(File(self.path, full_path))
@@ -337,6 +337,10 @@ def log_header(logger: logging.Logger, message: str) -> None:
         logger: The logger to use for logging the header message.
         message: The header message to log.
     """
+    # Skip building the header when info messages are not emitted (e.g. a logger set to WARNING)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     line_separator = "#" * 100
     formatted_message = f"########## {message}"
     formatted_message = f"{formatted_message} {line_separator[len(formatted_message) + 1 :]}"
@@ -26,6 +26,7 @@ _VALID_HOSTNAME_REGEX = re.compile(r"^([\w-]+\.)*[\w-]*api\.(fabric\.microsoft\.
 
 # Regular expression for valid GUIDs with dashes
 VALID_GUID_REGEX = r"^[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$"
+VALID_GUID_PATTERN = re.compile(VALID_GUID_REGEX)
 
 # Constants that hold API URLs and require URL validation
 _URL_CONSTANTS = {"DEFAULT_API_ROOT_URL", "FABRIC_API_ROOT_URL"}
@@ -101,7 +102,7 @@ def _get_fabric_fqdn_url(workspace_id: str) -> str:
         >>> url
         'https://f953f3dac5f04e36a644c85933e35e2f.zf9.w.api.fabric.microsoft.com'
     """
-    if not re.match(VALID_GUID_REGEX, workspace_id):
+    if not VALID_GUID_PATTERN.match(workspace_id):
         msg = f"workspace_id must be a valid GUID with dashes, got: '{workspace_id}'"
         raise ValueError(msg)
     no_dashes = workspace_id.replace("-", "")
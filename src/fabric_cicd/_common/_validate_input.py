@@ -104,7 +104,7 @@ def validate_workspace_id(input_value: str) -> str:
     """
     validate_data_type("string", "workspace_id", input_value)
 
-    if not re.match(constants.VALID_GUID_REGEX, input_value):
+    if not constants.VALID_GUID_PATTERN.match(input_value):
         msg = "The provided workspace_id is not a valid guid."
         raise InputError(msg, logger)
 
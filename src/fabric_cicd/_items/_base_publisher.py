@@ -7,11 +7,13 @@ import logging
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import filterfalse
 from typing import Callable, Optional
 
 from fabric_cicd import constants
 from fabric_cicd._common._exceptions import InputError, PublishError
 from fabric_cicd._common._item import Item
+from fabric_cicd._common._logging import log_header
 from fabric_cicd.constants import PARALLEL_MAX_WORKERS, ItemType
 from fabric_cicd.fabric_workspace import FabricWorkspace
 
@@ -32,11 +34,15 @@ class ParallelConfig:
         ordered_items_func: Optional callable that returns an ordered list of item names.
                            When provided, items are published sequentially in this order.
                            This takes precedence over `enabled=True`.
+        ordered_levels_func: Optional callable that returns item names grouped into dependency levels.
+                            When provided, levels are published in order and the items within a level
+                            in parallel. This takes precedence over `ordered_items_func`.
     """
 
     enabled: bool = True
     max_workers: Optional[int] = PARALLEL_MAX_WORKERS
     ordered_items_func: Optional[Callable[["ItemPublisher"], list[str]]] = None
+    ordered_levels_func: Optional[Callable[["ItemPublisher"], list[list[str]]]] = None
 
 
 class Publisher(ABC):
@@ -84,6 +90,7 @@ class ItemPublisher(Publisher):
     - Overriding post_publish_all() for cleanup after publishing
     - Overriding get_items_to_publish() to filter or order items
     - Overriding get_unpublish_order() for dependency-aware unpublishing
+    - Overriding get_unpublish_levels() to unpublish independent items concurrently
     - Overriding post_publish_all_check() for async publish state verification
 
     Publish Lifecycle:
@@ -93,8 +100,8 @@ class ItemPublisher(Publisher):
         4. post_publish_all()
         5. post_publish_all_check() - if has_async_publish_check
 
-    Unpublish Hook:
-        - get_unpublish_order() - if has_dependency_tracking
+    Unpublish Hooks:
+        - get_unpublish_levels() - if has_dependency_tracking, defaults to one level per get_unpublish_order() item
     """
 
     # region Class Attributes
@@ -224,14 +231,44 @@ class ItemPublisher(Publisher):
         """
         from fabric_cicd import constants
 
-        result = []
-        for order_num, item_type in constants.SERIAL_ITEM_PUBLISH_ORDER.items():
-            if (
-                item_type.value in fabric_workspace_obj.item_type_in_scope
-                and item_type.value in fabric_workspace_obj.repository_items
+        # Item types both in scope and in the repository, computed once rather than checked for every item type
+        publishable_item_types = frozenset(fabric_workspace_obj.item_type_in_scope).intersection(
+            fabric_workspace_obj.repository_items
+        )
+        return [
+            (order_num, item_type)
+            for order_num, item_type in constants.SERIAL_ITEM_PUBLISH_ORDER.items()
+            if item_type.value in publishable_item_types
+        ]
+
+    @staticmethod
+    def get_item_type_waves_to_publish(fabric_workspace_obj: "FabricWorkspace") -> list[list[tuple[int, ItemType]]]:
+        """
+        Get the ordered waves of item types that should be published, where the item types of a wave
+        do not depend on each other and can be published concurrently.
+
+        Returns the item types of get_item_types_to_publish() in their serial publish order, starting a new wave
+        whenever an item type references an item type of the current wave (see ITEM_TYPE_PUBLISH_DEPENDENCIES).
+
+        Args:
+            fabric_workspace_obj: The FabricWorkspace object containing scope and repository info.
+
+        Returns:
+            List of waves, each a list of (order_num, ItemType) tuples for item types that should be published.
+        """
+        from fabric_cicd import constants
+
+        waves: list[list[tuple[int, ItemType]]] = []
+        wave_item_types: set[ItemType] = set()
+        for order_num, item_type in ItemPublisher.get_item_types_to_publish(fabric_workspace_obj):
+            if not waves or not wave_item_types.isdisjoint(
+                constants.ITEM_TYPE_PUBLISH_DEPENDENCIES.get(item_type, frozenset())
             ):
-                result.append((order_num, item_type))
-        return result
+                waves.append([])
+                wave_item_types = set()
+            waves[-1].append((order_num, item_type))
+            wave_item_types.add(item_type)
+        return waves
 
     @staticmethod
     def get_item_types_to_unpublish(fabric_workspace_obj: "FabricWorkspace") -> list[str]:
@@ -249,20 +286,18 @@ class ItemPublisher(Publisher):
         """
         from fabric_cicd import constants
 
+        item_types_in_scope = frozenset(fabric_workspace_obj.item_type_in_scope)
+        deployed_items = fabric_workspace_obj.deployed_items
         unpublish_order = []
-        for item_type in reversed(list(constants.SERIAL_ITEM_PUBLISH_ORDER.values())):
-            if (
-                item_type.value in fabric_workspace_obj.item_type_in_scope
-                and item_type.value in fabric_workspace_obj.deployed_items
-            ):
-                unpublish_flag = constants.UNPUBLISH_FLAG_MAPPING.get(item_type.value)
+        for item_type, unpublish_flag in constants.SERIAL_ITEM_UNPUBLISH_ORDER:
+            if item_type in item_types_in_scope and item_type in deployed_items:
                 # Append item_type if no feature flag is required or the corresponding flag is enabled
                 if not unpublish_flag or unpublish_flag in constants.FEATURE_FLAG:
-                    unpublish_order.append(item_type.value)
-                elif unpublish_flag and unpublish_flag not in constants.FEATURE_FLAG:
+                    unpublish_order.append(item_type)
+                else:
                     # Log warning when unpublish is skipped due to missing feature flag
                     logger.warning(
-                        f"Skipping unpublish for {item_type.value} items because the '{unpublish_flag}' feature flag is not enabled."
+                        f"Skipping unpublish for {item_type} items because the '{unpublish_flag}' feature flag is not enabled."
                     )
         return unpublish_order
 
@@ -290,18 +325,23 @@ class ItemPublisher(Publisher):
         """
         import re
 
-        deployed_names = set(fabric_workspace_obj.deployed_items.get(item_type, {}).keys())
-        repository_names = set(fabric_workspace_obj.repository_items.get(item_type, {}).keys())
-        to_delete_set = deployed_names - repository_names
+        # Single lazy pass over the deployed names, in deployed order, without intermediate sets; the filters are
+        # bound methods, so filterfalse() runs them without a Python-level predicate per name
+        repository_names = fabric_workspace_obj.repository_items.get(item_type, {})
+        orphaned_names = filterfalse(
+            repository_names.__contains__, fabric_workspace_obj.deployed_items.get(item_type, {})
+        )
 
         if items_to_include is not None:
-            # Filter to only items in the include list
-            return [name for name in to_delete_set if f"{name}.{item_type}" in items_to_include]
-        if item_name_exclude_regex:
+            # Filter to only items in the include list, using a set for constant-time membership checks
+            include_set = set(items_to_include)
+            return [name for name in orphaned_names if f"{name}.{item_type}" in include_set]
+        # The default "^$" pattern only matches empty names, which items cannot have, so it is skipped like no pattern
+        if item_name_exclude_regex and item_name_exclude_regex != "^$":
             # Filter out items matching the exclude regex
             regex_pattern = re.compile(item_name_exclude_regex)
-            return [name for name in to_delete_set if not regex_pattern.match(name)]
-        return list(to_delete_set)
+            return list(filterfalse(regex_pattern.match, orphaned_names))
+        return list(orphaned_names)
 
     @staticmethod
     def publish_all_bulk(fabric_workspace_obj: "FabricWorkspace") -> list["ItemPublisher"]:
@@ -368,6 +408,42 @@ class ItemPublisher(Publisher):
 
         return [p for p in publishers if p.has_async_publish_check]
 
+    @staticmethod
+    def publish_all_by_wave(fabric_workspace_obj: "FabricWorkspace") -> list["ItemPublisher"]:
+        """
+        Execute publish_all() for all item types in scope, one wave of independent item types at a time.
+
+        The item types of a wave are published concurrently, and the next wave starts once all of them
+        have completed. If any item type of a wave fails, the first failure (in publish order) is raised.
+
+        The deployed items are refreshed before each wave to pick up the items published by earlier waves.
+        Item types of the wave can still refresh them while publishing, which is serialized by the workspace.
+
+        Returns:
+            List of publishers that have async checks pending.
+        """
+        total_item_types = len(constants.SERIAL_ITEM_PUBLISH_ORDER)
+        publishers_with_async_check: list[ItemPublisher] = []
+
+        def _publish_item_type(order_num: int, item_type: ItemType) -> "ItemPublisher":
+            log_header(logger, f"Publishing Item {order_num}/{total_item_types}: {item_type.value}")
+            publisher = ItemPublisher.create(item_type, fabric_workspace_obj)
+            publisher.publish_all()
+            return publisher
+
+        for wave in ItemPublisher.get_item_type_waves_to_publish(fabric_workspace_obj):
+            fabric_workspace_obj._refresh_deployed_items_if_changed()
+            with ThreadPoolExecutor(max_workers=len(wave)) as executor:
+                futures = [executor.submit(_publish_item_type, order_num, item_type) for order_num, item_type in wave]
+
+            # All item types of the wave have completed once the executor exits
+            for future in futures:
+                publisher = future.result()
+                if publisher.has_async_publish_check:
+                    publishers_with_async_check.append(publisher)
+
+        return publishers_with_async_check
+
     # endregion
 
     # region Public Methods
@@ -383,6 +459,7 @@ class ItemPublisher(Publisher):
         5. Raises PublishError if any items failed
 
         The parallel_config class attribute controls execution:
+        - If ordered_levels_func is set: publishes level by level, each level in parallel (takes precedence)
         - If ordered_items_func is set: publishes in that order sequentially
         - If enabled=True: publishes in parallel
         - If enabled=False: publishes sequentially
@@ -405,7 +482,10 @@ class ItemPublisher(Publisher):
 
         config = getattr(self.__class__, "parallel_config", ParallelConfig())
 
-        if config.ordered_items_func is not None:
+        if config.ordered_levels_func is not None:
+            levels = config.ordered_levels_func(self)
+            errors = self._publish_items_by_level(items, levels)
+        elif config.ordered_items_func is not None:
             order = config.ordered_items_func(self)
             errors = self._publish_items_ordered(items, order)
         elif config.enabled:
@@ -477,6 +557,61 @@ class ItemPublisher(Publisher):
         """
         return items_to_unpublish
 
+    def get_unpublish_levels(self, items_to_unpublish: list[str]) -> list[list[str]]:
+        """
+        Get the item names grouped into dependency levels for unpublishing.
+
+        Args:
+            items_to_unpublish: List of item names to be unpublished.
+
+        Returns:
+            Lists of item names, in the order the levels should be unpublished. The items within a level
+            do not depend on each other.
+
+        Default implementation puts each item of get_unpublish_order() in its own level.
+        Subclasses that can tell independent items apart should override to unpublish them concurrently.
+        """
+        return [[item_name] for item_name in self.get_unpublish_order(items_to_unpublish)]
+
+    def unpublish_all(self, items_to_unpublish: list[str]) -> None:
+        """
+        Unpublish the given deployed items of this publisher's item type.
+
+        Publishers with dependency tracking unpublish level by level (see get_unpublish_levels()), and
+        publishers that publish sequentially unpublish one item at a time. The deletes within a level are
+        otherwise issued in parallel.
+
+        Args:
+            items_to_unpublish: List of item names to be unpublished.
+        """
+        if not items_to_unpublish:
+            return
+
+        config = getattr(self.__class__, "parallel_config", ParallelConfig())
+        if self.has_dependency_tracking:
+            levels = self.get_unpublish_levels(items_to_unpublish)
+        elif not config.enabled or config.ordered_items_func is not None:
+            levels = [[item_name] for item_name in items_to_unpublish]
+        else:
+            levels = [items_to_unpublish]
+
+        for level in levels:
+            if len(level) == 1 or not config.enabled:
+                for item_name in level:
+                    self.fabric_workspace_obj._unpublish_item(item_name=item_name, item_type=self.item_type)
+                continue
+
+            # Delete failures are logged as warnings by _unpublish_item; anything else is raised as in sequential order
+            with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.fabric_workspace_obj._unpublish_item, item_name=item_name, item_type=self.item_type
+                    )
+                    for item_name in level
+                ]
+                for future in futures:
+                    future.result()
+
     def pre_publish_all(self) -> None:
         """
         Hook called before publishing any items.
@@ -586,6 +721,28 @@ class ItemPublisher(Publisher):
 
         return errors
 
+    def _publish_items_by_level(self, items: dict[str, "Item"], levels: list[list[str]]) -> list[tuple[str, Exception]]:
+        """
+        Publish items level by level, with the items within each level published in parallel.
+
+        Args:
+            items: Dictionary mapping item names to Item objects.
+            levels: Lists of item names, in the order the levels should be published.
+
+        Returns:
+            List of (item_name, exception) tuples for failed items.
+        """
+        errors: list[tuple[str, Exception]] = []
+
+        for level in levels:
+            level_items = {item_name: items[item_name] for item_name in level if item_name in items}
+            if len(level_items) == 1:
+                errors.extend(self._publish_items_sequential(level_items))
+            elif level_items:
+                errors.extend(self._publish_items_parallel(level_items))
+
+        return errors
+
     @staticmethod
     def _mark_skipped_items(
         fabric_workspace_obj: "FabricWorkspace",
@@ -14,13 +14,14 @@ from fabric_cicd._items._base_publisher import ItemPublisher, ParallelConfig
 from fabric_cicd._parameter._utils import (
     check_replacement,
     extract_find_value,
-    extract_parameter_filters,
     extract_replace_value,
 )
 from fabric_cicd.constants import ItemType
 
 logger = logging.getLogger(__name__)
 
+_DATAFLOW_SOURCE_PATTERN = re.compile(constants.DATAFLOW_SOURCE_REGEX, re.DOTALL)
+
 
 def set_dataflow_publish_order(workspace_obj: FabricWorkspace, item_type: str) -> list[str]:
     """
@@ -119,7 +120,7 @@ def contains_source_dataflow(file_content: str) -> bool:
     """A helper function to check if the file content contains a source dataflow reference."""
     try:
         # Check if file contains the PowerPlatform.Dataflows pattern (group 1 of the regex)
-        match = re.search(constants.DATAFLOW_SOURCE_REGEX, file_content, re.DOTALL)
+        match = _DATAFLOW_SOURCE_PATTERN.search(file_content)
         return match is not None and bool(match.group(1))
     except (re.error, TypeError, IndexError) as e:
         logger.debug(f"Error checking for source dataflow: {e}")
@@ -129,7 +130,7 @@ def contains_source_dataflow(file_content: str) -> bool:
 def get_source_dataflow_ids(file_content: str, item_name: str) -> tuple[str, str]:
     """A helper function to get the dataflow ID and workspace ID of a referenced dataflow."""
     try:
-        match = re.search(constants.DATAFLOW_SOURCE_REGEX, file_content, re.DOTALL)
+        match = _DATAFLOW_SOURCE_PATTERN.search(file_content)
         if not match:
             msg = f"No dataflow source pattern found in the '{item_name}' file content"
             raise ParsingError(msg, logger)
@@ -143,10 +144,10 @@ def get_source_dataflow_ids(file_content: str, item_name: str) -> tuple[str, str
         raise ParsingError(msg, logger) from e
 
     # Validate the extracted IDs are valid GUIDs
-    if not dataflow_workspace_id or not re.match(constants.VALID_GUID_REGEX, dataflow_workspace_id):
+    if not dataflow_workspace_id or not constants.VALID_GUID_PATTERN.match(dataflow_workspace_id):
         msg = f"Invalid workspace ID: {dataflow_workspace_id} in '{item_name}' file content"
         raise ParsingError(msg, logger)
-    if not dataflow_id or not re.match(constants.VALID_GUID_REGEX, dataflow_id):
+    if not dataflow_id or not constants.VALID_GUID_PATTERN.match(dataflow_id):
         msg = f"Invalid dataflow ID: {dataflow_id} in '{item_name}' file content"
         raise ParsingError(msg, logger)
 
@@ -164,10 +165,8 @@ def get_source_dataflow_name(
     # Get the IDs of the source dataflow
     dataflow_workspace_id, dataflow_id = get_source_dataflow_ids(file_content, item_name)
 
-    # Look for a parameter that contains the dataflow ID
-    for param in workspace_obj.environment_parameter.get("find_replace", []):
-        # Extract values from the parameter
-        input_type, input_name, input_path = extract_parameter_filters(workspace_obj, param)
+    # Look for a parameter that contains the dataflow ID (file filters are resolved once per parameter file)
+    for param, (input_type, input_name, input_path) in workspace_obj._get_parameter_entries("find_replace"):
         filter_match = check_replacement(
             input_type, input_name, input_path, ItemType.DATAFLOW.value, item_name, file_path
         )
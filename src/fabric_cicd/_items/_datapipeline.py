@@ -4,18 +4,17 @@
 """Functions to process and deploy DataPipeline item."""
 
 import logging
-import re
-
-import dpath
 
 from fabric_cicd import FabricWorkspace, constants
 from fabric_cicd._common._item import Item
 from fabric_cicd._items._base_publisher import ItemPublisher, ParallelConfig
-from fabric_cicd._items._manage_dependencies import set_publish_order, set_unpublish_order
+from fabric_cicd._items._manage_dependencies import set_publish_levels, set_unpublish_levels, set_unpublish_order
 from fabric_cicd.constants import ItemType
 
 logger = logging.getLogger(__name__)
 
+_GUID_LENGTH = len(constants.DEFAULT_GUID)
+
 
 def find_referenced_datapipelines(fabric_workspace_obj: FabricWorkspace, file_content: dict, lookup_type: str) -> list:
     """
@@ -28,12 +27,18 @@ def find_referenced_datapipelines(fabric_workspace_obj: FabricWorkspace, file_co
     """
     item_type = ItemType.DATA_PIPELINE.value
     reference_list = []
-    guid_pattern = re.compile(constants.VALID_GUID_REGEX)
 
-    # Use the dpath library to search through the dictionary for all values that match the GUID pattern
-    for _, value in dpath.search(file_content, "**", yielded=True):
-        if isinstance(value, str):
-            match = guid_pattern.search(value)
+    # Walk the dictionary depth-first (in document order) for all string values that match the GUID pattern
+    stack = [file_content]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(reversed(value.values()))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+        # The GUID pattern is anchored, so only strings of GUID length (optionally with a trailing newline) can match
+        elif isinstance(value, str) and _GUID_LENGTH <= len(value) <= _GUID_LENGTH + 1:
+            match = constants.VALID_GUID_PATTERN.search(value)
             if match:
                 # If a valid GUID is found, convert it to name. If name is not None, it's a pipeline and will be added to the reference list
                 referenced_id = match.group(0)
@@ -47,9 +52,9 @@ def find_referenced_datapipelines(fabric_workspace_obj: FabricWorkspace, file_co
     return reference_list
 
 
-def _get_datapipeline_publish_order(publisher: "DataPipelinePublisher") -> list[str]:
-    """Get the ordered list of data pipeline names based on dependencies."""
-    return set_publish_order(publisher.fabric_workspace_obj, publisher.item_type, find_referenced_datapipelines)
+def _get_datapipeline_publish_levels(publisher: "DataPipelinePublisher") -> list[list[str]]:
+    """Get the data pipeline names grouped into dependency levels, in publish order."""
+    return set_publish_levels(publisher.fabric_workspace_obj, publisher.item_type, find_referenced_datapipelines)
 
 
 class DataPipelinePublisher(ItemPublisher):
@@ -58,8 +63,8 @@ class DataPipelinePublisher(ItemPublisher):
     item_type = ItemType.DATA_PIPELINE.value
     has_dependency_tracking = True
 
-    parallel_config = ParallelConfig(enabled=False, ordered_items_func=_get_datapipeline_publish_order)
-    """Pipelines must be published in dependency order (sequential)"""
+    parallel_config = ParallelConfig(ordered_levels_func=_get_datapipeline_publish_levels)
+    """Pipelines must be published in dependency order (pipelines of the same dependency level in parallel)"""
 
     def get_unpublish_order(self, items_to_unpublish: list[str]) -> list[str]:
         """
@@ -75,10 +80,24 @@ class DataPipelinePublisher(ItemPublisher):
             self.fabric_workspace_obj, self.item_type, items_to_unpublish, find_referenced_datapipelines
         )
 
+    def get_unpublish_levels(self, items_to_unpublish: list[str]) -> list[list[str]]:
+        """
+        Get the item names grouped into dependency levels for unpublishing.
+
+        Args:
+            items_to_unpublish: List of item names to be unpublished.
+
+        Returns:
+            Lists of item names, in the order the levels should be unpublished (pipelines of the same level in parallel).
+        """
+        return set_unpublish_levels(
+            self.fabric_workspace_obj, self.item_type, items_to_unpublish, find_referenced_datapipelines
+        )
+
     def publish_one(self, item_name: str, _item: Item) -> None:
         """Publish a single Data Pipeline item."""
         self.fabric_workspace_obj._publish_item(item_name=item_name, item_type=self.item_type)
 
     def pre_publish_all(self) -> None:
         """Refresh deployed items before publishing to resolve references."""
-        self.fabric_workspace_obj._refresh_deployed_items()
+        self.fabric_workspace_obj._refresh_deployed_items_if_changed()
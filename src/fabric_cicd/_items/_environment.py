@@ -4,12 +4,12 @@
 """Functions to process and deploy Environment item."""
 
 import logging
-import re
 
 import dpath
 import yaml
 
 from fabric_cicd import FabricWorkspace, constants
+from fabric_cicd._common._check_utils import YAML_LOADER, check_regex
 from fabric_cicd._common._exceptions import InputError
 from fabric_cicd._common._fabric_endpoint import handle_retry
 from fabric_cicd._common._file import File
@@ -51,7 +51,7 @@ def _process_environment_file(
     if "instance_pool_id" not in contents:
         return contents
 
-    yaml_body = yaml.safe_load(contents)
+    yaml_body = yaml.load(contents, Loader=YAML_LOADER)
     if not isinstance(yaml_body, dict):
         return contents
 
@@ -146,15 +146,17 @@ def _check_environment_publish_state(fabric_workspace_obj: FabricWorkspace, init
     iteration = 1
 
     environments = fabric_workspace_obj.repository_items.get(ItemType.ENVIRONMENT.value, {})
+    exclude_pattern = (
+        check_regex(fabric_workspace_obj.publish_item_name_exclude_regex)
+        if fabric_workspace_obj.publish_item_name_exclude_regex
+        else None
+    )
     filtered_environments = [
         k
         for k in environments
         if (
             # Check exclude regex
-            (
-                not fabric_workspace_obj.publish_item_name_exclude_regex
-                or not re.search(fabric_workspace_obj.publish_item_name_exclude_regex, k)
-            )
+            (exclude_pattern is None or not exclude_pattern.search(k))
             # Check items_to_include list
             and (
                 fabric_workspace_obj.items_to_include is None
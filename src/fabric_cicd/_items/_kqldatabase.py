@@ -3,9 +3,72 @@
 
 """Functions to process and deploy KQL Database item."""
 
+import logging
+
+from fabric_cicd import FabricWorkspace
+from fabric_cicd._common._exceptions import ParsingError
 from fabric_cicd._items._base_publisher import ItemPublisher
 from fabric_cicd.constants import ItemType
 
+logger = logging.getLogger(__name__)
+
+
+def replace_empty_cluster_uris(fabric_workspace_obj: FabricWorkspace, data_sources: list, name_key: str) -> bool:
+    """
+    Replaces empty cluster URI values of KQL data sources with the cluster URI of their KQL Database source.
+    The cluster URI of each KQL Database is fetched once, however many data sources reference it.
+
+    Args:
+        fabric_workspace_obj: The FabricWorkspace object.
+        data_sources: List of data source dictionaries, updated in place.
+        name_key: Data source key holding the KQL Database item name.
+
+    Returns:
+        True if any cluster URI was replaced, otherwise False.
+    """
+    # Get the KQL Database items from the deployed items
+    database_items = fabric_workspace_obj.deployed_items.get(ItemType.KQL_DATABASE.value, {})
+    cluster_uris = {}
+    replaced = False
+
+    # If the cluster URI is empty, replace it with the cluster URI of the KQL database
+    for data_source in data_sources:
+        if data_source.get("clusterUri") != "":
+            continue
+
+        database_item_name = data_source.get(name_key)
+        logger.debug(f"Found empty cluster URI for database '{database_item_name}'")
+
+        if database_item_name not in cluster_uris:
+            database_item = database_items.get(database_item_name)
+            if not database_item:
+                msg = f"Cannot find the KQL Database source with name '{database_item_name}' as it is not yet deployed."
+                raise ParsingError(msg, logger)
+
+            # Get the cluster URI of the KQL database
+            kqldatabase_data = fabric_workspace_obj.endpoint.invoke(
+                method="GET",
+                url=f"{fabric_workspace_obj.base_api_url}/kqlDatabases/{database_item.guid}",
+            )
+            try:
+                kqldatabase_cluster_uri = kqldatabase_data["body"]["properties"]["queryServiceUri"]
+            except (KeyError, TypeError):
+                kqldatabase_cluster_uri = None
+
+            if not kqldatabase_cluster_uri:
+                msg = f"Cannot find the cluster URI for KQL Database '{database_item_name}'."
+                raise ParsingError(msg, logger)
+            cluster_uris[database_item_name] = kqldatabase_cluster_uri
+
+        # Replace the cluster URI value
+        data_source["clusterUri"] = cluster_uris[database_item_name]
+        replaced = True
+        logger.debug(
+            f"Updated the cluster URI for data source '{database_item_name}' with '{cluster_uris[database_item_name]}'"
+        )
+
+    return replaced
+
 
 class KQLDatabasePublisher(ItemPublisher):
     """Publisher for KQL Database items."""
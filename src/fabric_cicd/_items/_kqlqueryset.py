@@ -5,12 +5,13 @@
 
 import json
 import logging
+import re
 
-from fabric_cicd import FabricWorkspace
-from fabric_cicd._common._exceptions import ParsingError
+from fabric_cicd import FabricWorkspace, constants
 from fabric_cicd._common._file import File
 from fabric_cicd._common._item import Item
 from fabric_cicd._items._base_publisher import ItemPublisher
+from fabric_cicd._items._kqldatabase import replace_empty_cluster_uris
 from fabric_cicd.constants import ItemType
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,11 @@ def replace_cluster_uri(fabric_workspace_obj: FabricWorkspace, file_obj: File) -
         fabric_workspace_obj: The FabricWorkspace object.
         file_obj: The file object.
     """
+    # Skip parsing and re-serializing the raw file when there is no empty cluster URI to replace
+    if not re.search(constants.KQL_EMPTY_CLUSTER_URI_REGEX, file_obj.contents):
+        logger.debug("No empty cluster URIs found in KQL Queryset.")
+        return file_obj.contents
+
     # Create a dictionary from the raw file
     json_content_dict = json.loads(file_obj.contents)
 
@@ -50,39 +56,10 @@ def replace_cluster_uri(fabric_workspace_obj: FabricWorkspace, file_obj: File) -
         logger.debug("No data sources found in KQL Queryset.")
         return file_obj.contents
 
-    # Get the KQL Database items from the deployed items
-    database_items = fabric_workspace_obj.deployed_items.get(ItemType.KQL_DATABASE.value, {})
-
-    # If the cluster URI is empty, replace it with the cluster URI of the KQL database
-    for data_source in data_sources:
-        if data_source.get("clusterUri") == "":
-            database_item_name = data_source.get("databaseItemName")
-            logger.debug(f"Found empty cluster URI for database '{database_item_name}'")
-
-            database_item = database_items.get(database_item_name)
-            if not database_item:
-                msg = f"Cannot find the KQL Database source with name '{database_item_name}' as it is not yet deployed."
-                raise ParsingError(msg, logger)
-
-            database_item_guid = database_item.guid
-            # Get the cluster URI of the KQL database
-            kqldatabase_data = fabric_workspace_obj.endpoint.invoke(
-                method="GET",
-                url=f"{fabric_workspace_obj.base_api_url}/kqlDatabases/{database_item_guid}",
-            )
-            try:
-                kqldatabase_cluster_uri = kqldatabase_data["body"]["properties"]["queryServiceUri"]
-            except (KeyError, TypeError):
-                kqldatabase_cluster_uri = None
-
-            if not kqldatabase_cluster_uri:
-                msg = f"Cannot find the cluster URI for KQL Database '{database_item_name}'."
-                raise ParsingError(msg, logger)
-            # Replace the cluster URI value
-            data_source["clusterUri"] = kqldatabase_cluster_uri
-            logger.debug(
-                f"Updated the cluster URI for data source '{database_item_name}' with '{kqldatabase_cluster_uri}'"
-            )
+    # The empty cluster URI may belong to something other than a data source, so keep the file as is
+    if not replace_empty_cluster_uris(fabric_workspace_obj, data_sources, "databaseItemName"):
+        logger.debug("No empty cluster URIs found in KQL Queryset data sources.")
+        return file_obj.contents
 
     logger.debug("Successfully updated all empty cluster URIs.")
     return json.dumps(json_content_dict, indent=2)
@@ -101,4 +78,4 @@ class KQLQuerysetPublisher(ItemPublisher):
 
     def pre_publish_all(self) -> None:
         """Refresh deployed items to get KQL Database cluster URIs."""
-        self.fabric_workspace_obj._refresh_deployed_items()
+        self.fabric_workspace_obj._refresh_deployed_items_if_changed()
@@ -223,8 +223,17 @@ class ShortcutPublisher(Publisher):
         if self.fabric_workspace_obj.shortcut_exclude_regex:
             regex_pattern = check_regex(self.fabric_workspace_obj.shortcut_exclude_regex)
             original_count = len(shortcuts)
-            excluded_shortcuts = [s["name"] for s in shortcuts if "name" in s and regex_pattern.match(s["name"])]
-            shortcuts = [s for s in shortcuts if "name" in s and not regex_pattern.match(s["name"])]
+            # Match each shortcut name once, splitting the shortcuts into excluded names and kept shortcuts
+            excluded_shortcuts = []
+            kept_shortcuts = []
+            for s in shortcuts:
+                if "name" not in s:
+                    continue
+                if regex_pattern.match(s["name"]):
+                    excluded_shortcuts.append(s["name"])
+                else:
+                    kept_shortcuts.append(s)
+            shortcuts = kept_shortcuts
             excluded_count = original_count - len(shortcuts)
             if excluded_count > 0:
                 logger.info(
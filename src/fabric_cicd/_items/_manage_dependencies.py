@@ -7,6 +7,7 @@ import base64
 import json
 import logging
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -16,11 +17,13 @@ from fabric_cicd._common._exceptions import ParsingError
 logger = logging.getLogger(__name__)
 
 
-def set_publish_order(
+def set_publish_levels(
     fabric_workspace_obj: FabricWorkspace, item_type: str, find_referenced_items_func: Callable
-) -> list:
+) -> list[list[str]]:
     """
-    Creates a publish order list for items of the same type, considering their dependencies.
+    Groups items of the same type into dependency levels, in publish order.
+
+    Items only reference items of earlier levels, so the items within a level can be published concurrently.
 
     Args:
         fabric_workspace_obj: The FabricWorkspace object.
@@ -43,29 +46,61 @@ def set_publish_order(
         item_content = json.loads(raw_file) if file_name.endswith(".json") else raw_file
         unsorted_dict[item_name] = item_content
 
-    # Return a list of items sorted by their dependencies
-    return sort_items(fabric_workspace_obj, unsorted_dict, "Repository", find_referenced_items_func)
+    referenced_items_by_name = {
+        item_name: find_referenced_items_func(fabric_workspace_obj, item_content, "Repository")
+        for item_name, item_content in unsorted_dict.items()
+    }
 
+    # Sort first so that dependency cycles are reported as before; referenced items always precede their dependents
+    sorted_items = sort_items(
+        fabric_workspace_obj,
+        {item_name: item_name for item_name in unsorted_dict},
+        "Repository",
+        lambda _workspace_obj, item_name, _lookup_type: referenced_items_by_name[item_name],
+    )
 
-def set_unpublish_order(
-    fabric_workspace_obj: FabricWorkspace,
-    item_type: str,
-    unpublish_list: list,
-    find_referenced_items_func: Callable,
-) -> list:
+    # An item's level is one more than the deepest level of the items it references
+    levels = _group_into_levels(sorted_items, referenced_items_by_name)
+
+    logger.debug(f"Publish levels: {levels}")
+    return levels
+
+
+def _group_into_levels(sorted_items: list[str], preceding_items_by_name: dict) -> list[list[str]]:
     """
-    Creates an unpublish order list for items of the same type, considering their dependencies.
+    Groups topologically sorted items into levels, each level following the levels of its preceding items.
+
+    Args:
+        sorted_items: Item names, each listed after all of its preceding items.
+        preceding_items_by_name: Dictionary mapping an item name to the item names that must precede it.
+    """
+    levels: list[list[str]] = []
+    level_by_name = {}
+    for item_name in sorted_items:
+        level = 1 + max(
+            (level_by_name[name] for name in preceding_items_by_name.get(item_name, []) if name in level_by_name),
+            default=-1,
+        )
+        level_by_name[item_name] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(item_name)
+
+    return levels
+
+
+def _get_deployed_contents(fabric_workspace_obj: FabricWorkspace, item_type: str, unpublish_list: list) -> dict:
+    """
+    Fetches the deployed definition file content of each item to unpublish.
 
     Args:
         fabric_workspace_obj: The FabricWorkspace object.
-        item_type: Type of item to order (e.g., 'DataPipeline').
+        item_type: Type of the items (e.g., 'DataPipeline').
         unpublish_list: List of items to unpublish.
-        find_referenced_items_func: Function to find referenced items in content.
     """
-    unsorted_item_dict = {}
     file_name = constants.ITEM_TYPE_TO_FILE[item_type]
 
-    for item_name in unpublish_list:
+    def _get_deployed_content(item_name: str) -> object:
         # Get deployed item definition
         # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/get-item-definition
         item_guid = fabric_workspace_obj.deployed_items[item_type][item_name].guid
@@ -75,17 +110,90 @@ def set_unpublish_order(
         for part in response["body"]["definition"]["parts"]:
             if part["path"] == file_name:
                 # Decode Base64 string to dictionary
-                decoded_bytes = base64.b64decode(part["payload"])
-                decoded_string = decoded_bytes.decode("utf-8")
-                unsorted_item_dict[item_name] = (
-                    json.loads(decoded_string) if file_name.endswith(".json") else decoded_string
-                )
-                break
+                decoded_string = base64.b64decode(part["payload"]).decode("utf-8")
+                return json.loads(decoded_string) if file_name.endswith(".json") else decoded_string
+        return None
+
+    # The definitions are independent requests, so fetch them concurrently; map() keeps the input order
+    with ThreadPoolExecutor(max_workers=max(1, min(constants.PARALLEL_MAX_WORKERS, len(unpublish_list)))) as executor:
+        deployed_contents = list(executor.map(_get_deployed_content, unpublish_list))
+
+    return {
+        item_name: item_content
+        for item_name, item_content in zip(unpublish_list, deployed_contents)
+        if item_content is not None
+    }
+
+
+def set_unpublish_order(
+    fabric_workspace_obj: FabricWorkspace,
+    item_type: str,
+    unpublish_list: list,
+    find_referenced_items_func: Callable,
+) -> list:
+    """
+    Creates an unpublish order list for items of the same type, considering their dependencies.
+
+    Unpublishing itself uses set_unpublish_levels(); this flat order stays for get_unpublish_order(), which
+    remains part of the publisher interface.
+
+    Args:
+        fabric_workspace_obj: The FabricWorkspace object.
+        item_type: Type of item to order (e.g., 'DataPipeline').
+        unpublish_list: List of items to unpublish.
+        find_referenced_items_func: Function to find referenced items in content.
+    """
+    unsorted_item_dict = _get_deployed_contents(fabric_workspace_obj, item_type, unpublish_list)
 
     # Determine order to delete w/o dependencies
     return sort_items(fabric_workspace_obj, unsorted_item_dict, "Deployed", find_referenced_items_func)
 
 
+def set_unpublish_levels(
+    fabric_workspace_obj: FabricWorkspace,
+    item_type: str,
+    unpublish_list: list,
+    find_referenced_items_func: Callable,
+) -> list[list[str]]:
+    """
+    Groups items of the same type into dependency levels, in unpublish order.
+
+    Items are only referenced by items to unpublish of earlier levels, so the items within a level can be
+    unpublished concurrently.
+
+    Args:
+        fabric_workspace_obj: The FabricWorkspace object.
+        item_type: Type of item to order (e.g., 'DataPipeline').
+        unpublish_list: List of items to unpublish.
+        find_referenced_items_func: Function to find referenced items in content.
+    """
+    unsorted_item_dict = _get_deployed_contents(fabric_workspace_obj, item_type, unpublish_list)
+
+    referenced_items_by_name = {
+        item_name: find_referenced_items_func(fabric_workspace_obj, item_content, "Deployed")
+        for item_name, item_content in unsorted_item_dict.items()
+    }
+
+    # Sort first so that dependency cycles are reported as before; referencing items always precede referenced items
+    sorted_items = sort_items(
+        fabric_workspace_obj,
+        {item_name: item_name for item_name in unsorted_item_dict},
+        "Deployed",
+        lambda _workspace_obj, item_name, _lookup_type: referenced_items_by_name[item_name],
+    )
+
+    referencing_items_by_name = defaultdict(list)
+    for item_name, referenced_items in referenced_items_by_name.items():
+        for referenced_name in referenced_items:
+            referencing_items_by_name[referenced_name].append(item_name)
+
+    # An item's level is one more than the deepest level of the items to unpublish that reference it
+    levels = _group_into_levels(sorted_items, referencing_items_by_name)
+
+    logger.debug(f"Unpublish levels: {levels}")
+    return levels
+
+
 def sort_items(
     fabric_workspace_obj: FabricWorkspace, unsorted_dict: dict, lookup_type: str, find_referenced_items_func: Callable
 ) -> list:
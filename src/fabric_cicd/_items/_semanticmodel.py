@@ -3,7 +3,6 @@
 
 """Functions to process and deploy Semantic Model item."""
 
-import copy
 import logging
 
 from fabric_cicd import FabricWorkspace, constants
@@ -34,7 +33,7 @@ def build_binding_mapping_legacy(fabric_workspace_obj: FabricWorkspace, semantic
     )
     item_type = "SemanticModel"
     binding_mapping = {}
-    repository_models = set(fabric_workspace_obj.repository_items.get(item_type, {}).keys())
+    repository_models = fabric_workspace_obj.repository_items.get(item_type, {}).keys()
 
     for entry in semantic_model_binding:
         connection_id = entry.get("connection_id")
@@ -112,7 +111,7 @@ def build_binding_mapping(
     """
     item_type = "SemanticModel"
     binding_mapping: dict[str, list] = {}
-    repository_models = set(fabric_workspace_obj.repository_items.get(item_type, {}).keys())
+    repository_models = fabric_workspace_obj.repository_items.get(item_type, {}).keys()
 
     # Get default connection_id(s) for this environment
     default_connection_ids = []
@@ -265,13 +264,13 @@ def bind_semanticmodel_to_connection(
             try:
                 logger.info(f"Binding semantic model '{model_name}' (ID: {model_id}) to connection '{connection_id}'")
 
-                # Deep-copy the template so nested objects are not shared across iterations
-                connection_binding = copy.deepcopy(connections_data[0])
-
-                # Update the connection binding with the target connection ID from parameter.yml
-                connection_binding["id"] = connection_id
-                connection_binding["connectivityType"] = connections[connection_id]["connectivityType"]
-                connection_binding["connectionDetails"] = connections[connection_id]["connectionDetails"]
+                # Build the connection binding from the target connection ID from parameter.yml. Every field of
+                # the request body comes from the target connection, so the existing binding is not copied.
+                connection_binding = {
+                    "id": connection_id,
+                    "connectivityType": connections[connection_id]["connectivityType"],
+                    "connectionDetails": connections[connection_id]["connectionDetails"],
+                }
 
                 # Build the request body
                 request_body = build_request_body({"connectionBinding": connection_binding})
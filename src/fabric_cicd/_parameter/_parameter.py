@@ -13,8 +13,10 @@ from typing import ClassVar, Optional
 import yaml
 
 import fabric_cicd.constants as constants
+from fabric_cicd._common._check_utils import YAML_LOADER
 from fabric_cicd._parameter._utils import (
     is_valid_structure,
+    parse_jsonpath,
     process_input_path,
     replace_variables_in_parameter_file,
 )
@@ -82,6 +84,8 @@ class Parameter:
         # Set class variables
         self.repository_directory = repository_directory
         self.item_type_in_scope = item_type_in_scope
+        # Set view of the item types in scope for the per-entry item type checks
+        self._item_types_in_scope = frozenset(item_type_in_scope)
         self.environment = environment
         self.parameter_file_name = parameter_file_name
         self.parameter_file_path = parameter_file_path
@@ -136,12 +140,20 @@ class Parameter:
     def _refresh_parameter_file(self) -> None:
         """Load parameters if file is present."""
         self.environment_parameter = {}
+        if self.parameter_file_path is None:
+            return
 
-        # Only proceed if the parameter file exists
-        if self._validate_parameter_file_exists():
+        # Open the file directly rather than stat-ing it first; a missing file is the rare path
+        try:
             is_valid, environment_parameter = self._validate_load_parameters_to_dict()
-            if is_valid:
-                self.environment_parameter = environment_parameter
+        except OSError:
+            # Only a missing (or non-file) parameter file is skipped, anything else still surfaces
+            if self._validate_parameter_file_exists():
+                raise
+            return
+
+        if is_valid:
+            self.environment_parameter = environment_parameter
 
     def _validate_parameter_file_exists(self) -> bool:
         """Validate the parameter file exists."""
@@ -167,7 +179,7 @@ class Parameter:
                     return False, parameter_dict
 
                 # Use custom loader that detects duplicate keys
-                parameter_dict = yaml.load(yaml_content, Loader=_DuplicateKeyLoader) or {}
+                parameter_dict = _load_yaml_with_duplicate_check(yaml_content) or {}
                 logger.debug(constants.PARAMETER_MSGS["passed"].format("YAML content is valid"))
 
                 if parameter_dict.get("extend"):
@@ -273,7 +285,7 @@ class Parameter:
                     return {}
 
             # Use custom loader that detects duplicate keys
-            return yaml.load(param_content, Loader=_DuplicateKeyLoader) or {}
+            return _load_yaml_with_duplicate_check(param_content) or {}
 
         except (UnicodeDecodeError, yaml.YAMLError) as e:
             logger.error(constants.PARAMETER_MSGS["template_file_error"].format(file_path, e))
@@ -659,7 +671,7 @@ class Parameter:
                     "Environment-specific dictionaries are not supported in the legacy format. "
                     "Please migrate to the new dictionary format with 'default' and 'models' keys."
                 )
-            if not re.match(constants.VALID_GUID_REGEX, connection_id):
+            if not constants.VALID_GUID_PATTERN.match(connection_id):
                 return False, f"connection_id '{connection_id}' is not a valid GUID in {context_name}"
             return True, f"Valid {context_name}"
 
@@ -684,13 +696,13 @@ class Parameter:
                                 False,
                                 f"connection_id list for environment '{env_key}' contains a non-string value: '{item}'",
                             )
-                        if not re.match(constants.VALID_GUID_REGEX, item):
+                        if not constants.VALID_GUID_PATTERN.match(item):
                             return (
                                 False,
                                 f"connection_id list for environment '{env_key}' contains an invalid GUID: '{item}'",
                             )
                 elif isinstance(guid_value, str):
-                    if not re.match(constants.VALID_GUID_REGEX, guid_value):
+                    if not constants.VALID_GUID_PATTERN.match(guid_value):
                         return False, f"connection_id for environment '{env_key}' is not a valid GUID: '{guid_value}'"
                 else:
                     return (
@@ -815,10 +827,8 @@ class Parameter:
             return False, "find_key must be an absolute JSONPath starting with '$'"
 
         try:
-            # jsonpath_ng.ext.parse supports extended JSONPath (dot/bracket)
-            from jsonpath_ng.ext import parse
-
-            parse(find_key)
+            # jsonpath_ng.ext.parse supports extended JSONPath (dot/bracket); the parsed expression is reused on replace
+            parse_jsonpath(find_key)
         except Exception as e:
             return False, f"Invalid JSONPath expression '{find_key}': {e}"
 
@@ -1024,7 +1034,7 @@ class Parameter:
 
     def _validate_item_type(self, input_type: str) -> tuple[bool, str]:
         """Validate the item type is in scope."""
-        if input_type not in self.item_type_in_scope:
+        if input_type not in self._item_types_in_scope:
             return False, constants.PARAMETER_MSGS["invalid item type"].format(input_type)
 
         return True, "Valid item type"
@@ -1073,6 +1083,30 @@ class _DuplicateKeyLoader(yaml.SafeLoader):
     pass
 
 
+class _FastDuplicateKeyLoader(YAML_LOADER):
+    """Variant of _DuplicateKeyLoader based on YAML_LOADER, backed by libyaml when PyYAML is built with libyaml."""
+
+    pass
+
+
+def _load_yaml_with_duplicate_check(content: str) -> object:
+    """
+    Load YAML content, raising an error on duplicate keys.
+
+    Parses with the libyaml backed loader when available. On a parse error the content is parsed again with the
+    pure Python loader, whose error messages include the offending source snippet.
+
+    Args:
+        content: The YAML content to load.
+    """
+    try:
+        return yaml.load(content, Loader=_FastDuplicateKeyLoader)
+    except yaml.YAMLError:
+        if YAML_LOADER is yaml.SafeLoader:
+            raise
+        return yaml.load(content, Loader=_DuplicateKeyLoader)
+
+
 def _collect_duplicate_key_errors(root_node: yaml.MappingNode, loader: _DuplicateKeyLoader) -> list[str]:
     """Collect duplicate key errors from all mapping nodes using iterative traversal."""
     errors: list[str] = []
@@ -1127,3 +1161,6 @@ def _check_duplicate_keys_constructor(loader: _DuplicateKeyLoader, node: yaml.Ma
 
 
 _DuplicateKeyLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _check_duplicate_keys_constructor)
+_FastDuplicateKeyLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _check_duplicate_keys_constructor
+)
@@ -13,14 +13,17 @@ import logging
 import os
 import re
 import urllib.parse
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 import yaml
+from jsonpath_ng import JSONPath
 from jsonpath_ng.ext import parse
 
 import fabric_cicd.constants as constants
 from fabric_cicd import FabricWorkspace
+from fabric_cicd._common._check_utils import YAML_LOADER
 from fabric_cicd._common._exceptions import InputError, ParsingError
 from fabric_cicd.constants import ItemType
 
@@ -47,20 +50,20 @@ def _validate_regex_structure(pattern: re.Pattern, find_value: str) -> None:
         raise InputError(msg, logger)
 
 
-def _validate_regex_pattern(matches: list, find_value: str) -> None:
+def _validate_regex_pattern(match: Optional[re.Match], find_value: str) -> None:
     """
-    Validates regex pattern matches to ensure the captured value is not empty.
+    Validates the first regex pattern match to ensure the captured value is not empty.
 
     Args:
-        matches: List of regex match objects
+        match: The first regex match object, or None if there is no match
         find_value: The regex pattern string for error messages
 
     Raises:
         InputError: If validation fails
     """
-    if matches:
+    if match:
         # Check if the captured group is empty (which would be invalid)
-        captured_value = matches[0].group(1)
+        captured_value = match.group(1)
         if not captured_value:
             msg = f"Regex pattern '{find_value}' captured an empty value."
             raise InputError(msg, logger)
@@ -129,20 +132,22 @@ def extract_find_value(
         if not filter_match:
             return {"pattern": find_value, "is_regex": True, "has_matches": False, "ignore_case": ignore_case}
 
-        matches = list(re.finditer(compiled, file_content))
-        _validate_regex_pattern(matches, find_value)
+        # Only the first match is needed to validate the pattern and detect matches
+        match = compiled.search(file_content)
+        _validate_regex_pattern(match, find_value)
 
-        return {"pattern": find_value, "is_regex": True, "has_matches": bool(matches), "ignore_case": ignore_case}
+        return {"pattern": find_value, "is_regex": True, "has_matches": match is not None, "ignore_case": ignore_case}
 
     # Non-regex find_value
     if not filter_match:
         return {"pattern": find_value, "is_regex": False, "has_matches": False, "ignore_case": ignore_case}
 
     if ignore_case:
+        # Match the same way the replacement does (re.IGNORECASE) rather than lowercasing a copy of the whole file
         return {
             "pattern": find_value,
             "is_regex": False,
-            "has_matches": find_value.lower() in file_content.lower(),
+            "has_matches": re.search(re.escape(find_value), file_content, re.IGNORECASE) is not None,
             "ignore_case": ignore_case,
         }
 
@@ -249,7 +254,7 @@ def _extract_workspace_id(workspace_obj: FabricWorkspace, replace_value: str) ->
 
             logger.debug(f"Extracted item type: {item_type}, item name: {item_name}, attribute: {attribute}")
 
-            if item_type not in constants.ACCEPTED_ITEM_TYPES:
+            if item_type not in constants.ACCEPTED_ITEM_TYPES_SET:
                 msg = f"Item type '{item_type}' is invalid or not supported"
                 raise ParsingError(msg, logger)
 
@@ -348,8 +353,8 @@ def _extract_item_attribute(workspace_obj: FabricWorkspace, variable: str, get_d
             f"Processing $items variable with item_type={item_type}, item_name={item_name}, attribute={attribute}"
         )
 
-        # Refresh the workspace items to get the latest deployed items
-        workspace_obj._refresh_deployed_items()
+        # Refresh the workspace items to pick up any items deployed since the last refresh
+        workspace_obj._refresh_deployed_items_if_changed()
 
         # Validate item type exists in the deployed workspace
         if item_type not in workspace_obj.workspace_items and not get_dataflow_name:
@@ -426,6 +431,20 @@ def process_environment_key(environment: str, replace_value_dict: dict) -> dict:
 """Functions to replace key values in JSON or YAML"""
 
 
+@lru_cache(maxsize=256)
+def parse_jsonpath(find_key: str) -> JSONPath:
+    """
+    Parses a JSONPath expression, reusing the parsed expression for repeated find_key values.
+
+    Parsing is far more expensive than evaluating the expression, and the same find_key is applied to every
+    matching file. Parsed expressions are not modified by find() or update(), so they can be shared.
+
+    Args:
+        find_key: The JSONPath expression to parse.
+    """
+    return parse(find_key)
+
+
 def replace_key_value(
     workspace_obj: FabricWorkspace, param_dict: dict, content: str, env: str, is_yaml: bool = False
 ) -> str:
@@ -441,7 +460,7 @@ def replace_key_value(
     # Parse content to a dictionary based on format (YAML or JSON)
     if is_yaml:
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YAML_LOADER)
         except yaml.YAMLError as ye:
             raise ValueError(ye) from ye
 
@@ -455,7 +474,7 @@ def replace_key_value(
             raise ValueError(jde) from jde
 
     # Extract the jsonpath expression from the find_key attribute of the param_dict
-    jsonpath_expr = parse(param_dict["find_key"])
+    jsonpath_expr = parse_jsonpath(param_dict["find_key"])
     replace_value_dict = process_environment_key(workspace_obj.environment, param_dict["replace_value"])
     for match in jsonpath_expr.find(data):
         # If the env is present in the replace_value array perform the replacement
@@ -482,7 +501,8 @@ def replace_variables_in_parameter_file(raw_file: str) -> str:
     Args:
     raw_file: The parameter.yml file content as a string.
     """
-    if "enable_environment_variable_replacement" in constants.FEATURE_FLAG:
+    # One scan for the placeholder prefix instead of one scan per environment variable when the file has none
+    if "enable_environment_variable_replacement" in constants.FEATURE_FLAG and "$ENV:" in raw_file:
         # filter os.environ dict to only allow variables that begin with $ENV:
         env_vars = {k[len("$ENV:") :]: v for k, v in os.environ.items() if k.startswith("$ENV:")}
         # block of code to support both variants of the parameters.yml file
@@ -6,6 +6,7 @@
 import os
 from enum import Enum
 
+from fabric_cicd._common._validate_env_vars import VALID_GUID_PATTERN as VALID_GUID_PATTERN
 from fabric_cicd._common._validate_env_vars import VALID_GUID_REGEX as VALID_GUID_REGEX
 from fabric_cicd._common._validate_env_vars import validate_env_var_api_url
 
@@ -110,6 +111,116 @@ SERIAL_ITEM_PUBLISH_ORDER: dict[int, ItemType] = {
     29: ItemType.MAP,
 }
 
+# Item types whose items an item type may reference. When parallel item type publish is enabled, the serial
+# publish order is split into waves of item types published concurrently, and an item type starts a new wave
+# when it references an item type of the current wave. Item types without references are not listed.
+ITEM_TYPE_PUBLISH_DEPENDENCIES: dict[ItemType, frozenset[ItemType]] = {
+    ItemType.WAREHOUSE: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.MIRRORED_DATABASE: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.LAKEHOUSE: frozenset({ItemType.VARIABLE_LIBRARY, ItemType.WAREHOUSE, ItemType.MIRRORED_DATABASE}),
+    ItemType.SQL_DATABASE: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.ENVIRONMENT: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.USER_DATA_FUNCTION: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.MIRRORED_DATABASE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+    }),
+    ItemType.EVENTHOUSE: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.SPARK_JOB_DEFINITION: frozenset({ItemType.VARIABLE_LIBRARY, ItemType.LAKEHOUSE, ItemType.ENVIRONMENT}),
+    ItemType.NOTEBOOK: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+        ItemType.ENVIRONMENT,
+        ItemType.USER_DATA_FUNCTION,
+        ItemType.EVENTHOUSE,
+    }),
+    ItemType.SEMANTIC_MODEL: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.MIRRORED_DATABASE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+        ItemType.EVENTHOUSE,
+    }),
+    ItemType.REPORT: frozenset({ItemType.SEMANTIC_MODEL}),
+    ItemType.PAGINATED_REPORT: frozenset({ItemType.SEMANTIC_MODEL}),
+    ItemType.COPY_JOB: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.MIRRORED_DATABASE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+    }),
+    ItemType.DATA_BUILD_TOOL_JOB: frozenset({ItemType.VARIABLE_LIBRARY, ItemType.WAREHOUSE, ItemType.LAKEHOUSE}),
+    ItemType.KQL_DATABASE: frozenset({ItemType.VARIABLE_LIBRARY, ItemType.EVENTHOUSE}),
+    ItemType.KQL_QUERYSET: frozenset({ItemType.VARIABLE_LIBRARY, ItemType.EVENTHOUSE, ItemType.KQL_DATABASE}),
+    ItemType.DATAFLOW: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.MIRRORED_DATABASE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+    }),
+    ItemType.DATA_PIPELINE: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+        ItemType.USER_DATA_FUNCTION,
+        ItemType.SPARK_JOB_DEFINITION,
+        ItemType.NOTEBOOK,
+        ItemType.COPY_JOB,
+        ItemType.DATA_BUILD_TOOL_JOB,
+        ItemType.KQL_DATABASE,
+        ItemType.DATAFLOW,
+    }),
+    ItemType.REFLEX: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.EVENTHOUSE,
+        ItemType.NOTEBOOK,
+        ItemType.KQL_DATABASE,
+        ItemType.DATA_PIPELINE,
+    }),
+    ItemType.EVENTSTREAM: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.LAKEHOUSE,
+        ItemType.EVENTHOUSE,
+        ItemType.KQL_DATABASE,
+        ItemType.REFLEX,
+    }),
+    ItemType.KQL_DASHBOARD: frozenset({ItemType.VARIABLE_LIBRARY, ItemType.EVENTHOUSE, ItemType.KQL_DATABASE}),
+    ItemType.GRAPHQL_API: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.MIRRORED_DATABASE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+    }),
+    ItemType.APACHE_AIRFLOW_JOB: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.MOUNTED_DATA_FACTORY: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.DATA_AGENT: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.WAREHOUSE,
+        ItemType.MIRRORED_DATABASE,
+        ItemType.LAKEHOUSE,
+        ItemType.SQL_DATABASE,
+        ItemType.SEMANTIC_MODEL,
+        ItemType.KQL_DATABASE,
+    }),
+    ItemType.ML_EXPERIMENT: frozenset({ItemType.VARIABLE_LIBRARY}),
+    ItemType.ONTOLOGY: frozenset({
+        ItemType.VARIABLE_LIBRARY,
+        ItemType.LAKEHOUSE,
+        ItemType.EVENTHOUSE,
+        ItemType.SEMANTIC_MODEL,
+    }),
+    ItemType.MAP: frozenset({ItemType.VARIABLE_LIBRARY, ItemType.LAKEHOUSE, ItemType.KQL_DATABASE, ItemType.ONTOLOGY}),
+}
+
 
 class FeatureFlag(str, Enum):
     """Enumeration of supported feature flags for fabric-cicd."""
@@ -148,6 +259,8 @@ class FeatureFlag(str, Enum):
     """Set to enable hard deletion of items, bypassing the workspace recycle bin."""
     ENABLE_BULK_PUBLISH = "enable_bulk_publish"
     """Set to enable publishing of items using the bulk import API."""
+    ENABLE_PARALLEL_ITEM_TYPE_PUBLISH = "enable_parallel_item_type_publish"
+    """Set to enable publishing of independent item types concurrently."""
 
 
 class OperationType(str, Enum):
@@ -168,12 +281,19 @@ UNPUBLISH_FLAG_MAPPING = {
     ItemType.KQL_DATABASE.value: FeatureFlag.ENABLE_KQLDATABASE_UNPUBLISH.value,
 }
 
+# Item type values in unpublish order (reverse publish order), each with the feature flag its unpublish requires, if any
+SERIAL_ITEM_UNPUBLISH_ORDER: tuple[tuple[str, str], ...] = tuple(
+    (item_type.value, UNPUBLISH_FLAG_MAPPING.get(item_type.value, ""))
+    for item_type in reversed(SERIAL_ITEM_PUBLISH_ORDER.values())
+)
+
 # Item Type
 ACCEPTED_ITEM_TYPES = tuple(item_type.value for item_type in ItemType)
-BULK_UNSUPPORTED_ITEM_TYPES = [
+ACCEPTED_ITEM_TYPES_SET = frozenset(ACCEPTED_ITEM_TYPES)
+BULK_UNSUPPORTED_ITEM_TYPES = frozenset({
     ItemType.DATA_BUILD_TOOL_JOB.value,
     ItemType.WAREHOUSE.value,
-]
+})
 BULK_ACCEPTED_ITEM_TYPES = tuple(
     item_type.value for item_type in ItemType if item_type.value not in BULK_UNSUPPORTED_ITEM_TYPES
 )
@@ -207,20 +327,25 @@ SENSITIVE_RESPONSE_HEADERS = frozenset({
 })
 
 # Publish
-SHELL_ONLY_PUBLISH = [
+SHELL_ONLY_PUBLISH = frozenset({
     ItemType.LAKEHOUSE.value,
     ItemType.WAREHOUSE.value,
     ItemType.SQL_DATABASE.value,
     ItemType.ML_EXPERIMENT.value,
-]
+})
 
 # Item count limit for bulk publish API (as per current API documentation)
 BULK_ITEM_COUNT_LIMIT = 1000
 
 # Items that do not require assigned capacity
-NO_ASSIGNED_CAPACITY_REQUIRED = [ItemType.SEMANTIC_MODEL.value, ItemType.REPORT.value, ItemType.PAGINATED_REPORT.value]
+NO_ASSIGNED_CAPACITY_REQUIRED = frozenset({
+    ItemType.SEMANTIC_MODEL.value,
+    ItemType.REPORT.value,
+    ItemType.PAGINATED_REPORT.value,
+})
 
-# Exclude Path Regex Patterns for filtering files during publish
+# Exclude Path Regex Patterns for filtering files during publish (the default matches nothing)
+DEFAULT_EXCLUDE_PATH_REGEX = r"^(?!.*)"
 EXCLUDE_PATH_REGEX_MAPPING = {
     ItemType.DATA_AGENT.value: r".*\.pbi[/\\].*",
     ItemType.REPORT.value: r".*\.pbi[/\\].*",
@@ -242,6 +367,7 @@ DATAFLOW_SOURCE_REGEX = (
 INVALID_FOLDER_CHAR_REGEX = r'[~"#.%&*:<>?/\\{|}]'
 KQL_DATABASE_FOLDER_PATH_REGEX = r"(?i)^(.*)/[^/]+\.Eventhouse/\.children(?:/.*)?$"
 DYNAMIC_VARIABLES_REGEX = r"^\$(workspace|items)\."
+KQL_EMPTY_CLUSTER_URI_REGEX = r'"clusterUri"\s*:\s*""'
 
 # Well known file names
 DATA_PIPELINE_CONTENT_FILE_JSON = "pipeline-content.json"
@@ -8,8 +8,9 @@ import logging
 import os
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import dpath
 from azure.core.credentials import TokenCredential
@@ -24,6 +25,9 @@ from fabric_cicd.constants import FeatureFlag, ItemType
 
 logger = logging.getLogger(__name__)
 
+_WORKSPACE_ID_REFERENCE_PATTERN = re.compile(constants.WORKSPACE_ID_REFERENCE_REGEX)
+_KQL_DATABASE_FOLDER_PATH_PATTERN = re.compile(constants.KQL_DATABASE_FOLDER_PATH_REGEX)
+
 
 class FabricWorkspace:
     """A class to manage and publish workspace items to the Fabric API."""
@@ -151,10 +155,35 @@ class FabricWorkspace:
         self._workspace_pools_cache: Optional[list[dict]] = None
         self._workspace_pools_cache_lock = threading.Lock()
 
+        # Initialize cache of the target workspace display name (used in $workspace.$name parameter resolution)
+        self._workspace_name_cache: Optional[str] = None
+        self._workspace_name_cache_lock = threading.Lock()
+
         # Initialize cache for _get_item_attribute method
         self._item_attribute_cache = {}
         self._item_attribute_cache_lock = threading.Lock()
 
+        # Initialize cache of item IDs per workspace (used in _lookup_item_attribute method)
+        self._workspace_item_ids_cache: dict[str, dict[tuple[str, str], str]] = {}
+        self._workspace_item_ids_cache_lock = threading.Lock()
+
+        # Track the repository directory of the last scan, as the repository is not modified during a deployment
+        # (see _refresh_repository_items_if_changed)
+        self._repository_items_scanned_directory: Optional[Path] = None
+
+        # Track changes made to the deployed items, so refreshes can be skipped when nothing has changed
+        # (see _refresh_deployed_items_if_changed)
+        self._deployed_items_version = 0
+        self._deployed_items_refreshed_version: Optional[int] = None
+        # Serializes refreshes requested by item types published concurrently
+        self._deployed_items_refresh_lock = threading.Lock()
+
+        # Initialize cache of lookup indexes derived from repository/deployed items and parameters (see _get_index)
+        self._index_cache: dict[str, tuple[object, object]] = {}
+
+        # Initialize cache of parsed .platform files keyed by path (used in _refresh_repository_items)
+        self._platform_cache: dict[str, tuple[int, int, dict]] = {}
+
         # Get parameter_file_path from kwargs
         self.parameter_file_path = kwargs.get("parameter_file_path")
 
@@ -194,26 +223,58 @@ class FabricWorkspace:
         raise InputError(msg, logger)
 
     def _resolve_workspace_name(self) -> str:
-        """Resolve workspace display name of the target workspace ID."""
-        response = self.endpoint.invoke(method="GET", url=f"{self._api_root_url}/v1/workspaces/{self.workspace_id}")
-        if "displayName" in response.get("body", {}):
-            return response["body"]["displayName"]
-        msg = f"Workspace name could not be resolved from workspace ID: {self.workspace_id}."
-        raise InputError(msg, logger)
+        """Resolve workspace display name of the target workspace ID, fetching from the API on first call."""
+        with self._workspace_name_cache_lock:
+            if self._workspace_name_cache is None:
+                response = self.endpoint.invoke(
+                    method="GET", url=f"{self._api_root_url}/v1/workspaces/{self.workspace_id}"
+                )
+                if "displayName" not in response.get("body", {}):
+                    msg = f"Workspace name could not be resolved from workspace ID: {self.workspace_id}."
+                    raise InputError(msg, logger)
+                self._workspace_name_cache = response["body"]["displayName"]
+
+            return self._workspace_name_cache
 
     def _lookup_item_attribute(self, workspace_id: str, item_type: str, item_name: str, attribute_name: str) -> str:
         """Lookup item attribute in the specified workspace based on item type and name."""
+        item_guid = self._get_workspace_item_ids(workspace_id).get((item_type, item_name))
+        if item_guid is None:
+            # The item may have been created after the workspace items were listed, so list them again
+            item_guid = self._get_workspace_item_ids(workspace_id, refresh=True).get((item_type, item_name))
+
+        if item_guid is None:
+            msg = f"Failed to look up item in workspace: {workspace_id}, item_type: {item_type}, item_name: {item_name}"
+            raise InputError(msg, logger)
+
+        if attribute_name == "id":
+            return item_guid
+        # For other attribute, use the item guid to get the attribute value
+        return self._get_item_attribute(workspace_id, item_type, item_guid, item_name, attribute_name)
+
+    def _get_workspace_item_ids(self, workspace_id: str, refresh: bool = False) -> dict[tuple[str, str], str]:
+        """
+        Returns the IDs of the items in the specified workspace keyed by item type and name.
+
+        The items of each workspace are listed once and cached, rather than on every lookup.
+
+        Args:
+            workspace_id: The ID of the workspace.
+            refresh: If True, list the workspace items again even if they are cached.
+        """
+        with self._workspace_item_ids_cache_lock:
+            if not refresh and workspace_id in self._workspace_item_ids_cache:
+                return self._workspace_item_ids_cache[workspace_id]
+
         response = self.endpoint.invoke(method="GET", url=f"{self._api_root_url}/v1/workspaces/{workspace_id}/items")
+        item_ids = {}
         for item in response["body"]["value"]:
-            if item["type"] == item_type and item["displayName"] == item_name:
-                item_guid = item["id"]
-                if attribute_name == "id":
-                    return item_guid
-                # For other attribute, use the item guid to get the attribute value
-                return self._get_item_attribute(workspace_id, item_type, item_guid, item_name, attribute_name)
-
-        msg = f"Failed to look up item in workspace: {workspace_id}, item_type: {item_type}, item_name: {item_name}"
-        raise InputError(msg, logger)
+            # Keep the first match, as the previous linear scan did
+            item_ids.setdefault((item["type"], item["displayName"]), item["id"])
+
+        with self._workspace_item_ids_cache_lock:
+            self._workspace_item_ids_cache[workspace_id] = item_ids
+        return item_ids
 
     def _get_item_attribute(
         self, workspace_id: str, item_type: str, item_guid: str, item_name: str, attribute_name: str
@@ -314,98 +375,121 @@ class FabricWorkspace:
 
     def _refresh_repository_items(self) -> None:
         """Refreshes the repository_items dictionary by scanning the repository directory."""
-        self.repository_items = {}
+        self._repository_items_scanned_directory = None
+        self.repository_items = repository_items = {}
+        deployed_items = self.deployed_items
         empty_logical_id_paths = []  # Collect all paths with empty logical IDs
+        collected_items = []  # Items whose files are read once the scan completes
         visited_logical_ids = set()  # Track visited logical IDs to avoid duplicates
 
-        for root, _dirs, files in os.walk(self.repository_directory):
-            directory = Path(root)
-            # valid item directory with .platform file within
-            if ".platform" in files:
-                item_metadata_path = directory / ".platform"
-
-                # Print a warning and skip directory if empty
-                if not any(directory.iterdir()):
-                    logger.warning(f"Directory {directory.name} is empty.")
-                    continue
+        # Depth-first scan with os.scandir, reusing the cached entry types so each directory is listed once
+        directories = [str(self.repository_directory)]
+        while directories:
+            root = directories.pop()
+            item_metadata_path = None
+            item_metadata_entry = None
+            sub_directories = []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.name == ".platform" and entry.is_file():
+                            item_metadata_path = Path(entry.path)
+                            item_metadata_entry = entry
+                        elif entry.is_dir(follow_symlinks=False):
+                            sub_directories.append(entry.path)
+            except OSError as e:
+                logger.debug(f"Unable to scan directory {root}: {e}")
+                continue
 
-                # Attempt to read metadata file
-                try:
-                    with Path.open(item_metadata_path, encoding="utf-8") as file:
-                        item_metadata = json.load(file)
-                except FileNotFoundError as e:
-                    msg = f"{item_metadata_path} path does not exist in the specified repository. {e}"
-                    ParsingError(msg, logger)
-                except json.JSONDecodeError as e:
-                    msg = f"Error decoding JSON in {item_metadata_path}. {e}"
-                    ParsingError(msg, logger)
-
-                # Ensure required metadata fields are present
-                if "type" not in item_metadata["metadata"] or "displayName" not in item_metadata["metadata"]:
-                    msg = f"displayName & type are required in {item_metadata_path}"
-                    raise ParsingError(msg, logger)
-
-                item_type = item_metadata["metadata"]["type"]
-                item_description = item_metadata["metadata"].get("description", "")
-                item_name = item_metadata["metadata"]["displayName"]
-                item_logical_id = item_metadata["config"]["logicalId"]
-
-                # Check for empty logical ID and collect the path
-                if not item_logical_id or item_logical_id.strip() == "":
-                    empty_logical_id_paths.append(str(item_metadata_path))
-                    continue  # Skip processing this item further
-
-                # Validate duplicate logical IDs (skip default GUID as export API uses it as a placeholder)
-                if item_logical_id != constants.DEFAULT_GUID:
-                    if item_logical_id in visited_logical_ids:
-                        msg = f"Duplicate logicalId '{item_logical_id}' found in {item_metadata_path}"
-                        raise FailedPublishedItemStatusError(msg, logger)
-                    visited_logical_ids.add(item_logical_id)
-
-                elif self.bulk_publish_enabled:
-                    msg = (
-                        f"Item '{item_name}.{item_type}' has the default logicalId '{constants.DEFAULT_GUID}' "
-                        f"in the .platform file. The bulk import API only accepts a unique logicalId. "
-                    )
-                    raise InputError(msg, logger)
+            # Visit sub-directories in listing order (top-down, as os.walk did)
+            directories.extend(reversed(sub_directories))
 
-                item_path = directory
-                relative_path = f"/{directory.relative_to(self.repository_directory).as_posix()}"
-                # Special handling for KQLDatabase items:
-                # .Eventhouse/.children/ directory structure, requires extracting the
-                # parent folder path before the Eventhouse container, not just
-                # the immediate parent directory
-                if item_type == ItemType.KQL_DATABASE.value:
-                    pattern = re.compile(constants.KQL_DATABASE_FOLDER_PATH_REGEX)
-                    match = pattern.match(relative_path)
-                    relative_parent_path = match.group(1) if match else None
-                else:
-                    relative_parent_path = "/".join(relative_path.split("/")[:-1])
+            # valid item directory with .platform file within
+            if item_metadata_path is None:
+                continue
+            directory = Path(root)
 
-                if FeatureFlag.DISABLE_WORKSPACE_FOLDER_PUBLISH.value not in constants.FEATURE_FLAG:
-                    item_folder_id = self.repository_folders.get(relative_parent_path, "")
+            # Attempt to read metadata file, reusing the parsed content if unchanged since the last refresh
+            try:
+                # The scandir entry caches its stat result (free on Windows), avoiding a path re-resolve
+                file_stat = item_metadata_entry.stat()
+                cache_key = str(item_metadata_path)
+                cached_metadata = self._platform_cache.get(cache_key)
+                if cached_metadata and cached_metadata[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+                    item_metadata = cached_metadata[2]
                 else:
-                    item_folder_id = ""
-
-                # Get the GUID if the item is already deployed
-                item_guid = self.deployed_items.get(item_type, {}).get(item_name, Item("", "", "", "")).guid
-
-                if item_type not in self.repository_items:
-                    self.repository_items[item_type] = {}
-
-                # Add the item to the repository_items dictionary
-                self.repository_items[item_type][item_name] = Item(
-                    type=item_type,
-                    name=item_name,
-                    description=item_description,
-                    guid=item_guid,
-                    logical_id=item_logical_id,
-                    path=item_path,
-                    folder_id=item_folder_id,
-                    folder_path=relative_parent_path,
+                    item_metadata = json.loads(item_metadata_path.read_bytes())
+                    self._platform_cache[cache_key] = (file_stat.st_mtime_ns, file_stat.st_size, item_metadata)
+            except FileNotFoundError as e:
+                msg = f"{item_metadata_path} path does not exist in the specified repository. {e}"
+                ParsingError(msg, logger)
+            except json.JSONDecodeError as e:
+                msg = f"Error decoding JSON in {item_metadata_path}. {e}"
+                ParsingError(msg, logger)
+
+            # Ensure required metadata fields are present
+            if "type" not in item_metadata["metadata"] or "displayName" not in item_metadata["metadata"]:
+                msg = f"displayName & type are required in {item_metadata_path}"
+                raise ParsingError(msg, logger)
+
+            item_type = item_metadata["metadata"]["type"]
+            item_description = item_metadata["metadata"].get("description", "")
+            item_name = item_metadata["metadata"]["displayName"]
+            item_logical_id = item_metadata["config"]["logicalId"]
+
+            # Check for empty logical ID and collect the path
+            if not item_logical_id or item_logical_id.strip() == "":
+                empty_logical_id_paths.append(str(item_metadata_path))
+                continue  # Skip processing this item further
+
+            # Validate duplicate logical IDs (skip default GUID as export API uses it as a placeholder)
+            if item_logical_id != constants.DEFAULT_GUID:
+                if item_logical_id in visited_logical_ids:
+                    msg = f"Duplicate logicalId '{item_logical_id}' found in {item_metadata_path}"
+                    raise FailedPublishedItemStatusError(msg, logger)
+                visited_logical_ids.add(item_logical_id)
+
+            elif self.bulk_publish_enabled:
+                msg = (
+                    f"Item '{item_name}.{item_type}' has the default logicalId '{constants.DEFAULT_GUID}' "
+                    f"in the .platform file. The bulk import API only accepts a unique logicalId. "
                 )
+                raise InputError(msg, logger)
 
-                self.repository_items[item_type][item_name].collect_item_files()
+            item_path = directory
+            relative_path = f"/{directory.relative_to(self.repository_directory).as_posix()}"
+            # Special handling for KQLDatabase items:
+            # .Eventhouse/.children/ directory structure, requires extracting the
+            # parent folder path before the Eventhouse container, not just
+            # the immediate parent directory
+            if item_type == ItemType.KQL_DATABASE.value:
+                match = _KQL_DATABASE_FOLDER_PATH_PATTERN.match(relative_path)
+                relative_parent_path = match.group(1) if match else None
+            else:
+                relative_parent_path = "/".join(relative_path.split("/")[:-1])
+
+            if FeatureFlag.DISABLE_WORKSPACE_FOLDER_PUBLISH.value not in constants.FEATURE_FLAG:
+                item_folder_id = self.repository_folders.get(relative_parent_path, "")
+            else:
+                item_folder_id = ""
+
+            # Get the GUID if the item is already deployed
+            deployed_item = deployed_items.get(item_type, {}).get(item_name)
+            item_guid = deployed_item.guid if deployed_item is not None else ""
+
+            # Add the item to the repository_items dictionary
+            item = repository_items.setdefault(item_type, {})[item_name] = Item(
+                type=item_type,
+                name=item_name,
+                description=item_description,
+                guid=item_guid,
+                logical_id=item_logical_id,
+                path=item_path,
+                folder_id=item_folder_id,
+                folder_path=relative_parent_path,
+            )
+
+            collected_items.append(item)
 
         # If we found any empty logical IDs, raise an error with all paths
         if empty_logical_id_paths:
@@ -416,14 +500,39 @@ class FabricWorkspace:
                 msg = f"logicalId cannot be empty in the following files:\n  - {paths_list}"
             raise ParsingError(msg, logger)
 
+        # Read item files concurrently as items are independent and reading is I/O bound.
+        # Files excluded from publish for the item type are skipped before they are read.
+        def _collect_item_files(item: Item) -> None:
+            item.collect_item_files(constants.EXCLUDE_PATH_REGEX_MAPPING.get(item.type))
+
+        with ThreadPoolExecutor(max_workers=constants.PARALLEL_MAX_WORKERS) as executor:
+            # Consume the results so that any read error is raised here
+            list(executor.map(_collect_item_files, collected_items))
+
+        self._repository_items_scanned_directory = self.repository_directory
+
+    def _refresh_repository_items_if_changed(self) -> None:
+        """
+        Refreshes the repository items only if the repository directory was not scanned yet.
+
+        Used where only the repository item names are needed, so an operation following a publish in the same
+        deployment reuses its scan instead of reading every item file again.
+        """
+        if self._repository_items_scanned_directory != self.repository_directory:
+            self._refresh_repository_items()
+
     def _refresh_deployed_items(self) -> None:
         """Refreshes the deployed_items dictionary by querying the Fabric workspace items API."""
+        # Changes made while the items are listed are picked up by the next refresh
+        refreshed_version = self._deployed_items_version
+
         # Get all items in workspace
         # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/get-item
         response = self.endpoint.invoke(method="GET", url=f"{self.base_api_url}/items")
 
-        self.deployed_items = {}
-        self.workspace_items = {}
+        # Filled in locally and assigned once complete, so that concurrent readers never see a partial refresh
+        deployed_items = {}
+        workspace_items = {}
 
         for item in response["body"]["value"]:
             item_type = item["type"]
@@ -435,30 +544,23 @@ class FabricWorkspace:
             sql_endpoint_id = ""
             query_service_uri = ""
 
-            # Add an empty dictionary if the item type hasn't been added yet
-            if item_type not in self.deployed_items:
-                self.deployed_items[item_type] = {}
-
-            if item_type not in self.workspace_items:
-                self.workspace_items[item_type] = {}
-
             # Only collect attribute values when parameterization with dynamic variables is in use
             if self.contains_param_vars:
                 # Get additional properties
-                if item_type in [ItemType.LAKEHOUSE.value, ItemType.WAREHOUSE.value, ItemType.SQL_DATABASE.value]:
+                if item_type in (ItemType.LAKEHOUSE.value, ItemType.WAREHOUSE.value, ItemType.SQL_DATABASE.value):
                     sql_endpoint = self._get_item_attribute(
                         self.workspace_id, item_type, item_guid, item_name, "sqlendpoint"
                     )
                     sql_endpoint_id = self._get_item_attribute(
                         self.workspace_id, item_type, item_guid, item_name, "sqlendpointid"
                     )
-                if item_type in [ItemType.EVENTHOUSE.value]:
+                if item_type == ItemType.EVENTHOUSE.value:
                     query_service_uri = self._get_item_attribute(
                         self.workspace_id, item_type, item_guid, item_name, "queryserviceuri"
                     )
 
-            # Add item details to the deployed_items dictionary
-            self.deployed_items[item_type][item_name] = Item(
+            # Add item details to the deployed_items dictionary, creating the item type entry on first use
+            deployed_items.setdefault(item_type, {})[item_name] = Item(
                 type=item_type,
                 name=item_name,
                 description=item_description,
@@ -467,13 +569,72 @@ class FabricWorkspace:
             )
 
             # Add item details to the workspace_items dictionary required for parameterization (public-facing attributes)
-            self.workspace_items[item_type][item_name] = {
+            workspace_items.setdefault(item_type, {})[item_name] = {
                 "id": item_guid,
                 "sqlendpoint": sql_endpoint,
                 "sqlendpointid": sql_endpoint_id,
                 "queryserviceuri": query_service_uri,
             }
 
+        self.deployed_items = deployed_items
+        self.workspace_items = workspace_items
+        self._deployed_items_refreshed_version = refreshed_version
+
+    def _refresh_deployed_items_if_changed(self) -> None:
+        """
+        Refreshes the deployed items only if items were created, updated, moved or deleted since the last refresh.
+
+        Used where deployed items are refreshed to pick up items published earlier in the same deployment.
+        Item types published concurrently refresh one at a time, so a refresh that another item type just
+        completed is not repeated.
+        """
+        with self._deployed_items_refresh_lock:
+            if self._deployed_items_refreshed_version != self._deployed_items_version:
+                self._refresh_deployed_items()
+
+    def _get_index(self, index_name: str, source: object, build_index: Callable[[object], object]) -> object:
+        """
+        Returns a lookup index built from the source object, rebuilt whenever the source object is replaced.
+
+        repository_items, deployed_items and the environment parameters are replaced rather than mutated on
+        refresh, so the identity of the source object is enough to tell whether a cached index is stale.
+
+        Args:
+            index_name: The name of the index.
+            source: The object the index is built from.
+            build_index: Function building the index from the source object.
+        """
+        cached_index = self._index_cache.get(index_name)
+        if cached_index is None or cached_index[0] is not source:
+            cached_index = (source, build_index(source))
+            self._index_cache[index_name] = cached_index
+        return cached_index[1]
+
+    def _get_logical_id_index(self) -> tuple[dict[str, Item], Optional[re.Pattern]]:
+        """
+        Returns the repository items keyed by logical ID and a regex matching any of those logical IDs.
+
+        Items are stored rather than GUIDs so that GUIDs assigned after the index is built (on item creation)
+        are picked up. Placeholder logical IDs (default GUID) used by items via export API are left out.
+        """
+
+        def _build_index(repository_items: dict) -> tuple[dict[str, Item], Optional[re.Pattern]]:
+            items_by_logical_id = {
+                item_details.logical_id: item_details
+                for items in repository_items.values()
+                for item_details in items.values()
+                if item_details.logical_id and item_details.logical_id != constants.DEFAULT_GUID
+            }
+            # Longest logical IDs first so that an ID which is a prefix of another cannot shadow it
+            logical_id_pattern = (
+                re.compile("|".join(map(re.escape, sorted(items_by_logical_id, key=len, reverse=True))))
+                if items_by_logical_id
+                else None
+            )
+            return items_by_logical_id, logical_id_pattern
+
+        return self._get_index("logical_id", self.repository_items, _build_index)
+
     def _replace_logical_ids(self, raw_file: str) -> str:
         """
         Replaces logical IDs with deployed GUIDs in the raw file content.
@@ -481,22 +642,20 @@ class FabricWorkspace:
         Args:
             raw_file: The raw file content where logical IDs need to be replaced.
         """
-        for item_name in self.repository_items.values():
-            for item_details in item_name.values():
-                logical_id = item_details.logical_id
-                item_guid = item_details.guid
+        items_by_logical_id, logical_id_pattern = self._get_logical_id_index()
+        if logical_id_pattern is None:
+            return raw_file
 
-                # Skip placeholder logical IDs (default GUID) used by items via export API
-                if logical_id == constants.DEFAULT_GUID:
-                    continue
+        def _replace(match: re.Match) -> str:
+            logical_id = match.group(0)
+            item_guid = items_by_logical_id[logical_id].guid
+            if not item_guid:
+                msg = f"Cannot replace logical ID '{logical_id}' as referenced item is not yet deployed."
+                raise ParsingError(msg, logger)
+            return item_guid
 
-                if logical_id in raw_file:
-                    if item_guid == "":
-                        msg = f"Cannot replace logical ID '{logical_id}' as referenced item is not yet deployed."
-                        raise ParsingError(msg, logger)
-                    raw_file = raw_file.replace(logical_id, item_guid)
-
-        return raw_file
+        # Replace all logical IDs in a single pass over the file content
+        return logical_id_pattern.sub(_replace, raw_file)
 
     def _replace_parameters(self, file_obj: object, item_obj: object) -> str:
         """
@@ -506,86 +665,184 @@ class FabricWorkspace:
             file_obj: The File object instance that provides the file content and file path.
             item_obj: The Item object instance that provides the item type and item name.
         """
+        raw_file = file_obj.contents
+
+        # Dispatch to the handler of each replacement parameter present in the parameter file
+        for parameter_name, replace_func in self._PARAMETER_REPLACE_HANDLERS:
+            if parameter_name in self.environment_parameter:
+                raw_file = replace_func(self, raw_file, item_obj.type, item_obj.name, file_obj.file_path)
+
+        return raw_file
+
+    def _get_parameter_entries(self, parameter_name: str) -> list[tuple[dict, tuple]]:
+        """
+        Returns the entries of a replacement parameter paired with their file filter values.
+
+        File path filters are resolved against the repository (including wildcard globbing), so the filters are
+        extracted once per loaded parameter file rather than once per repository file.
+
+        Args:
+            parameter_name: The name of the replacement parameter (e.g., find_replace).
+        """
+        from fabric_cicd._parameter._utils import extract_parameter_filters
+
+        return self._get_index(
+            f"parameter_entries:{parameter_name}",
+            self.environment_parameter.get(parameter_name) or [],
+            lambda parameter_dicts: [
+                (parameter_dict, extract_parameter_filters(self, parameter_dict)) for parameter_dict in parameter_dicts
+            ],
+        )
+
+    def _get_find_replace_prefilter(self) -> tuple[Optional[re.Pattern], frozenset[int]]:
+        """
+        Returns a regex matching any plain find_value of the find_replace parameter, and the positions of the
+        entries with a plain find_value.
+
+        A plain find_value (not a regex or variable) can only be replaced where it occurs, so when the regex has
+        no match all plain entries are skipped with a single scan rather than one scan per entry. Regex and
+        variable find_values need per-entry validation and are always processed.
+        """
+
+        def _build_prefilter(parameter_dicts: list) -> tuple[Optional[re.Pattern], frozenset[int]]:
+            alternatives = []
+            plain_indexes = set()
+            for index, parameter_dict in enumerate(parameter_dicts):
+                find_value = parameter_dict.get("find_value")
+                is_regex = str(parameter_dict.get("is_regex", "")).lower() == "true"
+                if is_regex or not isinstance(find_value, str) or find_value.startswith("$"):
+                    continue
+                plain_indexes.add(index)
+                # An empty find_value never matches
+                if find_value:
+                    escaped_value = re.escape(find_value)
+                    if str(parameter_dict.get("ignore_case", "")).lower() == "true":
+                        escaped_value = f"(?i:{escaped_value})"
+                    alternatives.append(escaped_value)
+            prefilter = re.compile("|".join(alternatives)) if alternatives else None
+            return prefilter, frozenset(plain_indexes)
+
+        return self._get_index(
+            "find_replace_prefilter", self.environment_parameter.get("find_replace") or [], _build_prefilter
+        )
+
+    def _replace_key_value_parameters(self, raw_file: str, item_type: str, item_name: str, file_path: Path) -> str:
+        """
+        Replaces values of the key_value_replace parameter in JSON or YAML file content.
+
+        Args:
+            raw_file: The raw file content where values need to be replaced.
+            item_type: Type of the item the file belongs to.
+            item_name: Name of the item the file belongs to.
+            file_path: Path of the file.
+        """
+        from fabric_cicd._parameter._utils import check_replacement, replace_key_value
+
+        environment = self.environment
+        for parameter_dict, (input_type, input_name, input_path) in self._get_parameter_entries("key_value_replace"):
+            # Set the match condition from the file filter values
+            filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
+
+            # Perform replacement if condition is met and file contains valid JSON or YAML
+            if filter_match:
+                if check_valid_json_content(raw_file):
+                    raw_file = replace_key_value(self, parameter_dict, raw_file, environment)
+                elif check_valid_yaml_content(raw_file):
+                    raw_file = replace_key_value(self, parameter_dict, raw_file, environment, is_yaml=True)
+
+        return raw_file
+
+    def _replace_find_replace_parameters(self, raw_file: str, item_type: str, item_name: str, file_path: Path) -> str:
+        """
+        Replaces values of the find_replace parameter in the raw file content.
+
+        Args:
+            raw_file: The raw file content where values need to be replaced.
+            item_type: Type of the item the file belongs to.
+            item_name: Name of the item the file belongs to.
+            file_path: Path of the file.
+        """
         from fabric_cicd._parameter._utils import (
             check_replacement,
             extract_find_value,
-            extract_parameter_filters,
             extract_replace_value,
             process_environment_key,
-            replace_key_value,
         )
 
-        # Parse the file_obj and item_obj
-        raw_file = file_obj.contents
-        item_type = item_obj.type
-        item_name = item_obj.name
-        file_path = file_obj.file_path
-
-        if "key_value_replace" in self.environment_parameter:
-            for parameter_dict in self.environment_parameter.get("key_value_replace"):
-                # Extract the file filter values and set the match condition
-                input_type, input_name, input_path = extract_parameter_filters(self, parameter_dict)
-                filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
-
-                # Perform replacement if condition is met and file contains valid JSON or YAML
-                if filter_match:
-                    if check_valid_json_content(raw_file):
-                        raw_file = replace_key_value(self, parameter_dict, raw_file, self.environment)
-                    elif check_valid_yaml_content(raw_file):
-                        raw_file = replace_key_value(self, parameter_dict, raw_file, self.environment, is_yaml=True)
-
-        if "find_replace" in self.environment_parameter:
-            for parameter_dict in self.environment_parameter.get("find_replace"):
-                # Extract the file filter values and set the match condition
-                input_type, input_name, input_path = extract_parameter_filters(self, parameter_dict)
-                filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
-
-                # Extract the find_pattern and replace_value_dict
-                find_info = extract_find_value(parameter_dict, raw_file, filter_match, workspace_obj=self)
-                replace_value_dict = process_environment_key(self.environment, parameter_dict.get("replace_value", {}))
-
-                # Replace any found references with specified environment value if conditions are met
-                if filter_match and self.environment in replace_value_dict and find_info["has_matches"]:
-                    replace_value = extract_replace_value(self, replace_value_dict[self.environment])
-                    if replace_value:
-                        pattern = find_info["pattern"]
-                        is_regex = find_info["is_regex"]
-                        ignore_case = find_info["ignore_case"]
-                        flags = re.IGNORECASE if ignore_case else 0
-
-                        if is_regex:
-                            # For regex patterns, use re.sub with lambda to replace only the captured group
-                            # Use string slicing to precisely replace only the captured group (group 1)
-                            # The slicing calculates relative positions: match.start(1) - match.start(0) gives
-                            # the start position of group 1 within the full match, and similarly for end position
+        parameter_entries = self._get_parameter_entries("find_replace")
+        prefilter, plain_indexes = self._get_find_replace_prefilter()
+
+        # Skip plain find values with a single scan while the content contains none of them
+        checked_file = raw_file
+        plain_absent = prefilter is None or prefilter.search(raw_file) is None
+        if plain_absent and len(plain_indexes) == len(parameter_entries):
+            return raw_file
+
+        environment = self.environment
+        for index, (parameter_dict, (input_type, input_name, input_path)) in enumerate(parameter_entries):
+            if index in plain_indexes:
+                # Re-check only when a regex or variable entry has changed the content since the last check
+                if raw_file is not checked_file:
+                    checked_file = raw_file
+                    plain_absent = prefilter is None or prefilter.search(raw_file) is None
+                if plain_absent:
+                    continue
+
+            # Set the match condition from the file filter values
+            filter_match = check_replacement(input_type, input_name, input_path, item_type, item_name, file_path)
+
+            # Extract the find_pattern and replace_value_dict
+            find_info = extract_find_value(parameter_dict, raw_file, filter_match, workspace_obj=self)
+            replace_value_dict = process_environment_key(environment, parameter_dict.get("replace_value", {}))
+
+            # Replace any found references with specified environment value if conditions are met
+            if filter_match and environment in replace_value_dict and find_info["has_matches"]:
+                replace_value = extract_replace_value(self, replace_value_dict[environment])
+                if replace_value:
+                    pattern = find_info["pattern"]
+                    is_regex = find_info["is_regex"]
+                    ignore_case = find_info["ignore_case"]
+                    flags = re.IGNORECASE if ignore_case else 0
+
+                    if is_regex:
+                        # For regex patterns, use re.sub with lambda to replace only the captured group
+                        # Use string slicing to precisely replace only the captured group (group 1)
+                        # The slicing calculates relative positions: match.start(1) - match.start(0) gives
+                        # the start position of group 1 within the full match, and similarly for end position
+                        raw_file = re.sub(
+                            pattern,
+                            lambda match, repl=replace_value: (
+                                match.group(0)[: match.start(1) - match.start(0)]
+                                + repl
+                                + match.group(0)[match.end(1) - match.start(0) :]
+                            ),
+                            raw_file,
+                            flags=flags,
+                        )
+                        logger.debug(
+                            f"Replacing regex pattern '{pattern}' captured group with '{replace_value}' in {item_name}.{item_type}"
+                        )
+                    else:
+                        # For non-regex matches, use re.sub when case-insensitive, otherwise plain replace
+                        if ignore_case:
                             raw_file = re.sub(
-                                pattern,
-                                lambda match, repl=replace_value: (
-                                    match.group(0)[: match.start(1) - match.start(0)]
-                                    + repl
-                                    + match.group(0)[match.end(1) - match.start(0) :]
-                                ),
+                                re.escape(pattern),
+                                lambda _match, repl=replace_value: repl,
                                 raw_file,
-                                flags=flags,
-                            )
-                            logger.debug(
-                                f"Replacing regex pattern '{pattern}' captured group with '{replace_value}' in {item_name}.{item_type}"
+                                flags=re.IGNORECASE,
                             )
                         else:
-                            # For non-regex matches, use re.sub when case-insensitive, otherwise plain replace
-                            if ignore_case:
-                                raw_file = re.sub(
-                                    re.escape(pattern),
-                                    lambda _match, repl=replace_value: repl,
-                                    raw_file,
-                                    flags=re.IGNORECASE,
-                                )
-                            else:
-                                raw_file = raw_file.replace(pattern, replace_value)
-                            logger.debug(f"Replacing '{pattern}' with '{replace_value}' in {item_name}.{item_type}")
+                            raw_file = raw_file.replace(pattern, replace_value)
+                        logger.debug(f"Replacing '{pattern}' with '{replace_value}' in {item_name}.{item_type}")
 
         return raw_file
 
+    # Replacement parameters and their handlers, applied in this order by _replace_parameters
+    _PARAMETER_REPLACE_HANDLERS = (
+        ("key_value_replace", _replace_key_value_parameters),
+        ("find_replace", _replace_find_replace_parameters),
+    )
+
     def _replace_workspace_ids(self, raw_file: str) -> str:
         """
         Replaces feature branch workspace ID, default (i.e. 00000000-0000-0000-0000-000000000000) and non-default
@@ -594,9 +851,11 @@ class FabricWorkspace:
         Args:
             raw_file: The raw file content where workspace IDs need to be replaced.
         """
-        # Use re.sub to replace all matches
-        return re.sub(
-            constants.WORKSPACE_ID_REFERENCE_REGEX,
+        # Only default workspace ID references are replaced, so skip the scan if the file has none
+        if constants.DEFAULT_GUID not in raw_file:
+            return raw_file
+
+        return _WORKSPACE_ID_REFERENCE_PATTERN.sub(
             lambda match: (
                 match.group(0).replace(constants.DEFAULT_GUID, self.workspace_id)
                 if match.group(2) == constants.DEFAULT_GUID
@@ -605,6 +864,23 @@ class FabricWorkspace:
             raw_file,
         )
 
+    @staticmethod
+    def _build_item_lookup(items_by_type: dict, key_attr: str, value_attr: str) -> dict[str, dict]:
+        """
+        Builds a per item type lookup of one item attribute to another, keeping the first item for duplicate keys.
+
+        Args:
+            items_by_type: Items dictionary keyed by item type and item name (repository or deployed items).
+            key_attr: The item attribute to look up by.
+            value_attr: The item attribute to return.
+        """
+        lookup = {}
+        for item_type, items in items_by_type.items():
+            type_lookup = lookup[item_type] = {}
+            for item_details in items.values():
+                type_lookup.setdefault(getattr(item_details, key_attr), getattr(item_details, value_attr))
+        return lookup
+
     def _convert_id_to_name(self, item_type: str, generic_id: str, lookup_type: str) -> str:
         """
         For a given item_type and id, returns the item name. Special handling for both deployed and repository items.
@@ -614,14 +890,20 @@ class FabricWorkspace:
             generic_id: Logical id or item guid of the item based on lookup_type.
             lookup_type: Finding references in deployed file or repo file (Deployed or Repository).
         """
-        lookup_dict = self.repository_items if lookup_type == "Repository" else self.deployed_items
-
-        for item_details in lookup_dict[item_type].values():
-            lookup_id = item_details.logical_id if lookup_type == "Repository" else item_details.guid
-            if lookup_id == generic_id:
-                return item_details.name
-        # if not found
-        return None
+        if lookup_type == "Repository":
+            names_by_id = self._get_index(
+                "repository_name_by_logical_id",
+                self.repository_items,
+                lambda items: self._build_item_lookup(items, "logical_id", "name"),
+            )
+        else:
+            names_by_id = self._get_index(
+                "deployed_name_by_guid",
+                self.deployed_items,
+                lambda items: self._build_item_lookup(items, "guid", "name"),
+            )
+        # KeyError for an item type without items, None if the id is not found
+        return names_by_id[item_type].get(generic_id)
 
     def _convert_path_to_id(self, item_type: str, path: str) -> str:
         """
@@ -631,18 +913,36 @@ class FabricWorkspace:
             item_type: Type of the item (e.g., Notebook, Environment).
             path: Full path of the desired item.
         """
-        if item_type in self.repository_items:
-            for item_details in self.repository_items[item_type].values():
-                if item_details.path == Path(path):
-                    return item_details.logical_id
-        # if not found
-        return None
+        logical_ids_by_path = self._get_index(
+            "repository_logical_id_by_path",
+            self.repository_items,
+            lambda items: self._build_item_lookup(items, "path", "logical_id"),
+        )
+        # None if not found
+        return logical_ids_by_path.get(item_type, {}).get(Path(path))
+
+    @staticmethod
+    def _filter_excluded_files(item_files: list, exclude_path: Optional[str]) -> list:
+        """
+        Returns the item files whose relative path does not match the exclusion regex.
+
+        The default exclusion regex never matches, so the regex is skipped entirely in that case;
+        otherwise it is compiled once for the whole file list.
+
+        Args:
+            item_files: The File objects of the item.
+            exclude_path: Regex string of paths to exclude.
+        """
+        if not exclude_path or exclude_path == constants.DEFAULT_EXCLUDE_PATH_REGEX:
+            return item_files
+        exclude_pattern = re.compile(exclude_path)
+        return [file for file in item_files if not exclude_pattern.match(file.relative_path)]
 
     def _publish_item(
         self,
         item_name: str,
         item_type: str,
-        exclude_path: str = r"^(?!.*)",
+        exclude_path: str = constants.DEFAULT_EXCLUDE_PATH_REGEX,
         func_process_file: Optional[callable] = None,
         **kwargs,
     ) -> None:
@@ -683,20 +983,24 @@ class FabricWorkspace:
             combined_body = metadata_body
         else:
             item_payload = []
-            for file in item_files:
-                if not re.match(exclude_path, file.relative_path):
-                    if file.type == "text" and not str(file.file_path).endswith(".platform"):
-                        # Only enable parameter replacement in Variable Library item definition files
-                        if item_type == ItemType.VARIABLE_LIBRARY.value:
-                            file.contents = self._replace_parameters(file, item)
-                        # Apply default processing for all other item definition files
-                        else:
-                            file.contents = func_process_file(self, item, file) if func_process_file else file.contents
-                            file.contents = self._replace_logical_ids(file.contents)
-                            file.contents = self._replace_parameters(file, item)
-                            file.contents = self._replace_workspace_ids(file.contents)
-
-                    item_payload.append(file.base64_payload)
+            for file in self._filter_excluded_files(item_files, exclude_path):
+                if file.type == "text" and not str(file.file_path).endswith(".platform"):
+                    # Only enable parameter replacement in Variable Library item definition files
+                    if item_type == ItemType.VARIABLE_LIBRARY.value:
+                        file.contents = self._replace_parameters(file, item)
+                    # Apply default processing for all other item definition files
+                    else:
+                        if func_process_file is not None:
+                            file.contents = func_process_file(self, item, file)
+                        file.contents = self._replace_logical_ids(file.contents)
+                        file.contents = self._replace_parameters(file, item)
+                        file.contents = self._replace_workspace_ids(file.contents)
+
+                item_payload.append(file.base64_payload)
+                # The part holds its own base64 copy, so drop the text instead of keeping both in memory.
+                # Variable Library settings are read again after publish to activate the value set.
+                if file.type == "text" and item_type != ItemType.VARIABLE_LIBRARY.value:
+                    file.contents = None
             # Some item definitions require specifying the format as multiple API versions exist (i.e. Spark Job Definitions)
             if kwargs.get("api_format"):
                 definition_body = {"definition": {"format": kwargs["api_format"], "parts": item_payload}}
@@ -707,6 +1011,8 @@ class FabricWorkspace:
         logger.info(f"Publishing {item_type} '{item_name}'")
 
         is_deployed = bool(item_guid)
+        # Look up the deployed counterpart once; it is compared for both the metadata and the folder checks
+        deployed_item = self.deployed_items.get(item_type, {}).get(item_name) if is_deployed else None
 
         if not is_deployed:
             combined_body = {**combined_body, **{"folderId": item.folder_id}}
@@ -718,7 +1024,8 @@ class FabricWorkspace:
             )
             api_response = item_create_response
             item_guid = item_create_response["body"]["id"]
-            self.repository_items[item_type][item_name].guid = item_guid
+            item.guid = item_guid
+            self._deployed_items_version += 1
 
         elif is_deployed and not shell_only_publish:
             # Update the item's definition if full publish is required
@@ -730,40 +1037,46 @@ class FabricWorkspace:
             )
             api_response = update_response
         elif is_deployed and shell_only_publish:
-            # Remove the 'type' key as it's not supported in the update-item API
-            metadata_body.pop("type", None)
-
-            # Update the item's metadata
-            # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/update-item
-            metadata_update_response = self.endpoint.invoke(
-                method="PATCH",
-                url=f"{self.base_api_url}/items/{item_guid}",
-                body=metadata_body,
-            )
-            api_response = metadata_update_response
-
-        if FeatureFlag.DISABLE_WORKSPACE_FOLDER_PUBLISH.value not in constants.FEATURE_FLAG:
-            deployed_item = self.deployed_items.get(item_type, {}).get(item_name) if is_deployed else None
-            # Check if the folder has changed
-            if deployed_item is not None and deployed_item.folder_id != item.folder_id:
-                # Move the item to the correct folder if it has been moved
-                # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/move-item
-                move_response = self.endpoint.invoke(
-                    method="POST",
-                    url=f"{self.base_api_url}/items/{item_guid}/move",
-                    body={"targetFolderId": f"{item.folder_id}"},
-                )
-                # For move operations, combine responses if we're tracking them
-                if self.responses is not None:
-                    if api_response:
-                        # If we already have a response, combine them
-                        api_response = {"publish_response": api_response, "move_response": move_response}
-                    else:
-                        # If move is the only operation, use the move response
-                        api_response = move_response
-                logger.debug(
-                    f"Moved {item_guid} from folder_id {self.deployed_items[item_type][item_name].folder_id} to folder_id {item.folder_id}"
+            # Skip the metadata round trip when the deployed item already matches (name is the pairing key),
+            # unless responses are collected, as the collected response comes from the update call
+            if self.responses is None and deployed_item is not None and deployed_item.description == item_description:
+                logger.debug(f"Metadata for {item_type} '{item_name}' is unchanged, skipping update")
+            else:
+                # Remove the 'type' key as it's not supported in the update-item API
+                metadata_body.pop("type", None)
+
+                # Update the item's metadata
+                # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/update-item
+                metadata_update_response = self.endpoint.invoke(
+                    method="PATCH",
+                    url=f"{self.base_api_url}/items/{item_guid}",
+                    body=metadata_body,
                 )
+                api_response = metadata_update_response
+                self._deployed_items_version += 1
+
+        # Move the item to the correct folder if it has been moved
+        if (
+            FeatureFlag.DISABLE_WORKSPACE_FOLDER_PUBLISH.value not in constants.FEATURE_FLAG
+            and deployed_item is not None
+            and deployed_item.folder_id != item.folder_id
+        ):
+            # https://learn.microsoft.com/en-us/rest/api/fabric/core/items/move-item
+            move_response = self.endpoint.invoke(
+                method="POST",
+                url=f"{self.base_api_url}/items/{item_guid}/move",
+                body={"targetFolderId": f"{item.folder_id}"},
+            )
+            self._deployed_items_version += 1
+            # For move operations, combine responses if we're tracking them
+            if self.responses is not None:
+                if api_response:
+                    # If we already have a response, combine them
+                    api_response = {"publish_response": api_response, "move_response": move_response}
+                else:
+                    # If move is the only operation, use the move response
+                    api_response = move_response
+            logger.debug(f"Moved {item_guid} from folder_id {deployed_item.folder_id} to folder_id {item.folder_id}")
 
         # Store response if responses are being tracked
         if self.responses is not None and api_response:
@@ -805,6 +1118,7 @@ class FabricWorkspace:
             },
             max_duration=1800,  # 30 minutes, as bulk operations can take longer time to complete
         )
+        self._deployed_items_version += 1
 
         # Log results grouped by operation type
         details = response.get("body", {}).get("importItemDefinitionsDetails", [])
@@ -854,7 +1168,9 @@ class FabricWorkspace:
             item: The Item object.
             publisher: The publisher context required for processing the item files.
         """
-        exclude_path = constants.EXCLUDE_PATH_REGEX_MAPPING.get(publisher.item_type, r"^(?!.*)")
+        exclude_path = constants.EXCLUDE_PATH_REGEX_MAPPING.get(
+            publisher.item_type, constants.DEFAULT_EXCLUDE_PATH_REGEX
+        )
         func_process_file = getattr(publisher, "func_process_file", None)
 
         # Build the workspace-relative prefix for this item's files, e.g., "/Folder1/Folder2/MyReport.Report"
@@ -863,9 +1179,7 @@ class FabricWorkspace:
         path_prefix = f"{folder_path}/{item_dir_name}"
 
         parts = []
-        for file in item.item_files:
-            if re.match(exclude_path, file.relative_path):
-                continue
+        for file in self._filter_excluded_files(item.item_files, exclude_path):
             if file.type == "text" and not str(file.file_path).endswith(".platform"):
                 file.contents = func_process_file(self, item, file) if func_process_file else file.contents
                 file.contents = self._replace_parameters(file, item)
@@ -895,6 +1209,7 @@ class FabricWorkspace:
             hard_delete = FeatureFlag.ENABLE_HARD_DELETE.value in constants.FEATURE_FLAG
             delete_url = f"{self.base_api_url}/items/{item_guid}" + ("?hardDelete=true" if hard_delete else "")
             api_response = self.endpoint.invoke(method="DELETE", url=delete_url)
+            self._deployed_items_version += 1
             logger.info(f"{constants.INDENT}Unpublished {item_type} '{item_name}'")
 
             # Store response if responses are being tracked
@@ -911,6 +1226,15 @@ class FabricWorkspace:
                 )
             logger.warning(msg)
 
+    def _refresh_deployed_items_and_folders(self) -> None:
+        """Refreshes the deployed items and deployed folders concurrently, as the two listings are independent."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self._refresh_deployed_items), executor.submit(self._refresh_deployed_folders)]
+
+        # Consume the results so that any error is raised here
+        for future in futures:
+            future.result()
+
     def _refresh_deployed_folders(self) -> None:
         """
         Converts the folder list payload into a structure of folder name and their ids
@@ -1078,14 +1402,16 @@ class FabricWorkspace:
 
     def _publish_folders(self) -> None:
         """Publishes all folders from the repository."""
-        # Sort folders by the number of '/' in their paths (ascending order)
-        sorted_folders = sorted(self.repository_folders.keys(), key=lambda path: path.count("/"))
+        # Sort folders by the number of '/' in their paths (ascending order), then by path for a stable order
+        sorted_folders = [path for _, path in sorted((path.count("/"), path) for path in self.repository_folders)]
         log_header(logger, "Publishing Workspace Folders")
         logger.info("Publishing Workspace Folders")
+        regex_pattern = (
+            check_regex(self.publish_folder_path_exclude_regex) if self.publish_folder_path_exclude_regex else None
+        )
         for folder_path in sorted_folders:
             # Skip folders matching the exclusion regex
-            if self.publish_folder_path_exclude_regex:
-                regex_pattern = check_regex(self.publish_folder_path_exclude_regex)
+            if regex_pattern:
                 if regex_pattern.search(folder_path):
                     logger.info(f"Skipping publishing of folder '{folder_path}' due to folder path exclusion regex.")
                     continue
@@ -1144,10 +1470,13 @@ class FabricWorkspace:
 
     def _unpublish_folders(self) -> None:
         """Unpublishes all empty folders in workspace."""
-        # Sort folders by the number of '/' in their paths (descending order)
+        # Sort folders by the number of '/' in their paths (descending order), then by path for a stable order
         sorted_folder_ids = [
-            self.deployed_folders[key]
-            for key in sorted(self.deployed_folders.keys(), key=lambda path: path.count("/"), reverse=True)
+            folder_id
+            for _, _, folder_id in sorted(
+                ((path.count("/"), path, folder_id) for path, folder_id in self.deployed_folders.items()),
+                reverse=True,
+            )
         ]
 
         ## Any folder that neither contains items nor is an ancestor of a folder
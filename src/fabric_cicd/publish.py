@@ -6,7 +6,6 @@
 import logging
 from typing import Optional
 
-import dpath
 from azure.core.credentials import TokenCredential
 
 import fabric_cicd._items as items
@@ -192,7 +191,39 @@ def publish_all_items(
         ...     publish_all_items(workspace, items_to_include=changed)
     """
     fabric_workspace_obj = validate_fabric_workspace_obj(fabric_workspace_obj)
-    
+
+    # Validate all inputs and feature flags before any API call, so invalid input never leaves a partial deployment
+    if (
+        FeatureFlag.ENABLE_BULK_PUBLISH.value in constants.FEATURE_FLAG
+        and FeatureFlag.ENABLE_EXPERIMENTAL_FEATURES.value not in constants.FEATURE_FLAG
+    ):
+        msg = "The 'enable_bulk_publish' feature flag requires 'enable_experimental_features' to be enabled."
+        raise InputError(msg, logger)
+
+    if (
+        FeatureFlag.ENABLE_PARALLEL_ITEM_TYPE_PUBLISH.value in constants.FEATURE_FLAG
+        and FeatureFlag.ENABLE_EXPERIMENTAL_FEATURES.value not in constants.FEATURE_FLAG
+    ):
+        msg = "The 'enable_parallel_item_type_publish' feature flag requires 'enable_experimental_features' to be enabled."
+        raise InputError(msg, logger)
+
+    if FeatureFlag.DISABLE_WORKSPACE_FOLDER_PUBLISH.value not in constants.FEATURE_FLAG:
+        if folder_path_exclude_regex is not None and folder_path_to_include is not None:
+            msg = "Cannot use both 'folder_path_exclude_regex' and 'folder_path_to_include' simultaneously. Choose one filtering strategy."
+            raise InputError(msg, logger)
+
+        if folder_path_exclude_regex is not None:
+            validate_folder_path_exclude_regex(folder_path_exclude_regex)
+
+        if folder_path_to_include is not None:
+            validate_folder_path_to_include(folder_path_to_include)
+
+    if items_to_include is not None:
+        validate_items_to_include(items_to_include, operation=constants.OperationType.PUBLISH)
+
+    if shortcut_exclude_regex:
+        validate_shortcut_exclude_regex(shortcut_exclude_regex)
+
     # Initialize response collection if feature flag is enabled
     responses_enabled = FeatureFlag.ENABLE_RESPONSE_COLLECTION.value in constants.FEATURE_FLAG
     if responses_enabled:
@@ -203,9 +234,9 @@ def publish_all_items(
     response_state = fabric_workspace_obj.endpoint.invoke(
         method="GET", url=f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/{fabric_workspace_obj.workspace_id}"
     )
-    has_assigned_capacity = dpath.get(response_state, "body/capacityId", default=None)
-    if not has_assigned_capacity and not set(fabric_workspace_obj.item_type_in_scope).issubset(
-        set(constants.NO_ASSIGNED_CAPACITY_REQUIRED)
+    has_assigned_capacity = (response_state.get("body") or {}).get("capacityId")
+    if not has_assigned_capacity and not constants.NO_ASSIGNED_CAPACITY_REQUIRED.issuperset(
+        fabric_workspace_obj.item_type_in_scope
     ):
         msg = f"Workspace {fabric_workspace_obj.workspace_id} does not have an assigned capacity. Please assign a capacity before publishing items."
         raise FailedPublishedItemStatusError(msg, logger)
@@ -214,10 +245,6 @@ def publish_all_items(
     fabric_workspace_obj.bulk_publish_enabled = False
     # Determine publishing mode path (standard vs. bulk) based on feature flags and input parameters
     if FeatureFlag.ENABLE_BULK_PUBLISH.value in constants.FEATURE_FLAG:
-        if FeatureFlag.ENABLE_EXPERIMENTAL_FEATURES.value not in constants.FEATURE_FLAG:
-            msg = "The 'enable_bulk_publish' feature flag requires 'enable_experimental_features' to be enabled."
-            raise InputError(msg, logger)
-        
         reasons = []
         unsupported = set(fabric_workspace_obj.item_type_in_scope) - set(constants.BULK_ACCEPTED_ITEM_TYPES)
         # Fall back to standard deployment if unsupported item types or dynamic parameter variables are detected, otherwise enable bulk publish
@@ -236,25 +263,20 @@ def publish_all_items(
 
     # Apply selective deployment features
     if FeatureFlag.DISABLE_WORKSPACE_FOLDER_PUBLISH.value not in constants.FEATURE_FLAG:
-        if folder_path_exclude_regex is not None and folder_path_to_include is not None:
-            msg = "Cannot use both 'folder_path_exclude_regex' and 'folder_path_to_include' simultaneously. Choose one filtering strategy."
-            raise InputError(msg, logger)
-
         if folder_path_exclude_regex is not None:
-            validate_folder_path_exclude_regex(folder_path_exclude_regex)
             fabric_workspace_obj.publish_folder_path_exclude_regex = folder_path_exclude_regex
 
         if folder_path_to_include is not None:
-            validate_folder_path_to_include(folder_path_to_include)
             fabric_workspace_obj.publish_folder_path_to_include = folder_path_to_include
 
-        fabric_workspace_obj._refresh_deployed_folders()
+        fabric_workspace_obj._refresh_deployed_items_and_folders()
         fabric_workspace_obj._refresh_repository_folders()
 
         if not fabric_workspace_obj.bulk_publish_enabled:
             fabric_workspace_obj._publish_folders()
+    else:
+        fabric_workspace_obj._refresh_deployed_items()
 
-    fabric_workspace_obj._refresh_deployed_items()
     fabric_workspace_obj._refresh_repository_items()
 
     if item_name_exclude_regex:
@@ -264,11 +286,9 @@ def publish_all_items(
         fabric_workspace_obj.publish_item_name_exclude_regex = item_name_exclude_regex
 
     if items_to_include is not None:
-        validate_items_to_include(items_to_include, operation=constants.OperationType.PUBLISH)
         fabric_workspace_obj.items_to_include = items_to_include
 
     if shortcut_exclude_regex:
-        validate_shortcut_exclude_regex(shortcut_exclude_regex)
         fabric_workspace_obj.shortcut_exclude_regex = shortcut_exclude_regex
 
     # Execute chosen publish mode
@@ -276,6 +296,9 @@ def publish_all_items(
         # Publish all items in bulk (experimental)
         log_header(logger, "Publishing Items in Bulk")
         publishers_with_async_check = items.ItemPublisher.publish_all_bulk(fabric_workspace_obj)
+    elif FeatureFlag.ENABLE_PARALLEL_ITEM_TYPE_PUBLISH.value in constants.FEATURE_FLAG:
+        # Publish independent item types concurrently, one wave at a time (experimental)
+        publishers_with_async_check = items.ItemPublisher.publish_all_by_wave(fabric_workspace_obj)
     else:
         # Publish items in the defined order synchronously (standard)
         total_item_types = len(constants.SERIAL_ITEM_PUBLISH_ORDER)
@@ -392,11 +415,14 @@ def unpublish_all_orphan_items(
     if responses_enabled:
         fabric_workspace_obj.unpublish_responses = {}
 
+    # Deployed items are always listed again, as publishing may create items (e.g. the KQL Database of an Eventhouse)
     fabric_workspace_obj._refresh_deployed_items()
-    fabric_workspace_obj._refresh_repository_items()
+    # The repository is only scanned again if publish_all_items has not scanned it already
+    fabric_workspace_obj._refresh_repository_items_if_changed()
     log_header(logger, "Unpublishing Orphaned Items")
 
     # Build unpublish order based on reversed publish order, scope, and feature flags
+    any_unpublished = False
     for item_type in items.ItemPublisher.get_item_types_to_unpublish(fabric_workspace_obj):
         to_delete_list = items.ItemPublisher.get_orphaned_items(
             fabric_workspace_obj,
@@ -409,14 +435,15 @@ def unpublish_all_orphan_items(
             logger.debug(f"Items to include for unpublishing ({item_type}): {to_delete_list}")
 
         publisher = items.ItemPublisher.create(ItemType(item_type), fabric_workspace_obj)
-        if to_delete_list and publisher.has_dependency_tracking:
-            to_delete_list = publisher.get_unpublish_order(to_delete_list)
+        publisher.unpublish_all(to_delete_list)
+        if to_delete_list:
+            any_unpublished = True
 
-        for item_name in to_delete_list:
-            fabric_workspace_obj._unpublish_item(item_name=item_name, item_type=item_type)
-
-    fabric_workspace_obj._refresh_deployed_items()
-    fabric_workspace_obj._refresh_deployed_folders()
+    # Deployed items only change when items were unpublished; folders may still have been orphaned by a publish
+    if any_unpublished:
+        fabric_workspace_obj._refresh_deployed_items_and_folders()
+    else:
+        fabric_workspace_obj._refresh_deployed_folders()
     if FeatureFlag.DISABLE_WORKSPACE_FOLDER_PUBLISH.value not in constants.FEATURE_FLAG:
         fabric_workspace_obj._unpublish_folders()
 
@@ -5,7 +5,12 @@ import json
 
 import pytest
 
-from fabric_cicd._common._check_utils import check_file_type, check_valid_json_content, check_valid_yaml_content
+from fabric_cicd._common._check_utils import (
+    check_file_type,
+    check_regex,
+    check_valid_json_content,
+    check_valid_yaml_content,
+)
 
 
 @pytest.fixture
@@ -290,3 +295,16 @@ if __name__ == "__main__":
     df.show()
 """
     assert check_valid_yaml_content(python_content) is False
+
+
+def test_check_regex_reuses_compiled_pattern():
+    """Test that check_regex compiles a pattern once and still rejects invalid patterns."""
+    check_regex.cache_clear()
+    pattern = check_regex("^Skip.*")
+
+    assert check_regex("^Skip.*") is pattern
+    assert check_regex.cache_info().hits == 1
+    assert pattern.match("Skip me")
+
+    with pytest.raises(ValueError, match="An error occurred with the regex provided"):
+        check_regex("[unclosed")
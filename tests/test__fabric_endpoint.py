@@ -1,16 +1,26 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import http.server
+import threading
 import time
 from unittest.mock import Mock
 
 import pytest
 import requests
 from azure.core.exceptions import ClientAuthenticationError
+from urllib3.response import HTTPResponse
 
 from fabric_cicd import constants
 from fabric_cicd._common._exceptions import InvokeError, TokenError
-from fabric_cicd._common._fabric_endpoint import FabricEndpoint, _format_invoke_log, _handle_response, handle_retry
+from fabric_cicd._common._fabric_endpoint import (
+    _TRANSIENT_RETRY_MAX_DELAY_SECONDS,
+    FabricEndpoint,
+    _create_session,
+    _format_invoke_log,
+    _handle_response,
+    handle_retry,
+)
 
 
 class DummyLogger:
@@ -44,7 +54,7 @@ def setup_mocks(monkeypatch, mocker):
     mock_logger.info.side_effect = dl.info
     mock_logger.debug.side_effect = dl.debug
     monkeypatch.setattr("fabric_cicd._common._fabric_endpoint.logger", mock_logger)
-    mock_requests = mocker.patch("requests.request")
+    mock_requests = mocker.patch("requests.Session.request")
     return dl, mock_requests
 
 
@@ -637,3 +647,136 @@ def test_format_invoke_log():
     assert "URL: http://example.com" in log_message
     assert "Response Status: 200" in log_message
     assert "Request Body:" in log_message
+
+
+def test_invoke_reuses_session(setup_mocks):
+    """Test that all calls of an endpoint go through one pooled requests session."""
+    _, mock_requests = setup_mocks
+    mock_requests.return_value = Mock(
+        status_code=200, headers={"Content-Type": "application/json"}, json=Mock(return_value={})
+    )
+    mock_token_credential = Mock()
+    mock_token_credential.get_token.return_value = Mock(token=generate_mock_token(), expires_on=9999999999)
+    endpoint = FabricEndpoint(token_credential=mock_token_credential)
+
+    endpoint.invoke("GET", "http://example.com")
+    endpoint.invoke("GET", "http://example.com")
+
+    assert isinstance(endpoint.requests, requests.Session)
+    assert mock_requests.call_count == 2
+    assert endpoint.requests.get_adapter("https://api.fabric.microsoft.com")._pool_maxsize >= 10
+
+
+def test_endpoints_share_session():
+    """Test that separate endpoint instances reuse the same pooled session across both API hosts."""
+    mock_token_credential = Mock()
+    mock_token_credential.get_token.return_value = Mock(token=generate_mock_token(), expires_on=9999999999)
+
+    first = FabricEndpoint(token_credential=mock_token_credential)
+    second = FabricEndpoint(token_credential=mock_token_credential)
+
+    assert first.requests is second.requests
+    assert first.requests.get_adapter("https://api.powerbi.com") is first.requests.get_adapter(
+        "https://api.fabric.microsoft.com"
+    )
+
+
+def test_shared_session_created_once_across_threads(monkeypatch):
+    """Test that endpoints created concurrently from worker threads all get the same pooled session."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from fabric_cicd._common import _fabric_endpoint
+
+    created = []
+
+    def slow_create_session():
+        time.sleep(0.01)
+        created.append(requests.Session())
+        return created[-1]
+
+    monkeypatch.setattr(_fabric_endpoint, "_SHARED_SESSION", None)
+    monkeypatch.setattr(_fabric_endpoint, "_create_session", slow_create_session)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(lambda _: _fabric_endpoint._get_shared_session(), range(8)))
+
+    assert len(created) == 1
+    assert all(session is created[0] for session in sessions)
+
+
+def test_invoke_formats_log_only_when_needed(setup_mocks, mocker, monkeypatch):
+    """Test that the request/response log message is not built when debug logging is off and no error occurs."""
+    _, mock_requests = setup_mocks
+    mock_logger = mocker.Mock()
+    mock_logger.isEnabledFor.return_value = False
+    monkeypatch.setattr("fabric_cicd._common._fabric_endpoint.logger", mock_logger)
+    mock_format = mocker.patch("fabric_cicd._common._fabric_endpoint._format_invoke_log", return_value="log message")
+    mock_requests.return_value = Mock(
+        status_code=200, headers={"Content-Type": "application/json"}, json=Mock(return_value={})
+    )
+    mock_token_credential = Mock()
+    mock_token_credential.get_token.return_value = Mock(token=generate_mock_token(), expires_on=9999999999)
+    endpoint = FabricEndpoint(token_credential=mock_token_credential)
+
+    endpoint.invoke("POST", "http://example.com", {"definition": {"parts": []}})
+    mock_format.assert_not_called()
+
+    mock_requests.return_value = Mock(status_code=400, headers={"Content-Type": "application/json"})
+    with pytest.raises(InvokeError):
+        endpoint.invoke("POST", "http://example.com", {"definition": {"parts": []}})
+    mock_format.assert_called_once()
+
+
+def test_shared_session_retries_transient_gateway_errors():
+    """Test that the pooled session retries gateway errors on idempotent requests and honors Retry-After."""
+    session = _create_session()
+    retry = session.get_adapter("https://api.fabric.microsoft.com").max_retries
+
+    assert set(retry.status_forcelist) == {502, 503, 504}
+    assert 429 not in retry.status_forcelist
+    assert retry.respect_retry_after_header
+    assert retry.connect == 0
+    assert retry.read == 0
+    assert not retry.raise_on_status
+    assert not retry.is_retry("POST", 503)
+    assert retry.is_retry("GET", 503)
+
+    # Exponential backoff is capped, whatever the backoff factor and number of failed attempts
+    retry = retry.new(backoff_factor=100)
+    for _ in range(3):
+        retry = retry.increment(method="GET", url="/operations/1", response=HTTPResponse(status=503))
+    assert retry.get_backoff_time() == _TRANSIENT_RETRY_MAX_DELAY_SECONDS
+
+
+def test_shared_session_caps_retry_after_wait(monkeypatch):
+    """Test that a 503 with a long Retry-After is retried by the pooled session after a capped wait."""
+    responses = [(503, {"Retry-After": "3600"}), (200, {})]
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            status, headers = responses.pop(0)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_args):
+            pass
+
+    sleeps = []
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", sleeps.append)
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = _create_session()
+        response = session.get(f"http://127.0.0.1:{server.server_port}/operations/1", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert sleeps == [_TRANSIENT_RETRY_MAX_DELAY_SECONDS]
+    assert not responses
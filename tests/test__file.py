@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from fabric_cicd._common._exceptions import FileTypeError
 from fabric_cicd._common._file import File
 
 SAMPLE_IMAGE_DATA = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
@@ -90,3 +91,19 @@ def test_file_text_special_characters(tmp_path):
         "payload": expected_payload,
         "payloadType": "InlineBase64",
     }
+
+
+def test_file_text_newlines_translated(tmp_path):
+    item_path = tmp_path / "workspace/ABC.Notebook"
+    file_path = item_path / "notebook-content.py"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"line1\r\nline2\rline3\n")
+    file_obj = File(item_path=item_path, file_path=file_path)
+    assert file_obj.contents == file_path.read_text(encoding="utf-8") == "line1\nline2\nline3\n"
+
+
+def test_file_read_error_raises_file_type_error(tmp_path):
+    item_path = tmp_path / "workspace/ABC.Notebook"
+    item_path.mkdir(parents=True)
+    with pytest.raises(FileTypeError):
+        File(item_path=item_path, file_path=item_path / "missing.py")
@@ -3,6 +3,7 @@
 
 """Unit tests for ConfigValidator class."""
 
+import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -88,6 +89,19 @@ class TestConfigValidator:
         assert result == config_data
         assert self.validator.errors == []
 
+    def test_validate_yaml_content_parses_with_shared_loader(self, tmp_path):
+        """Test _validate_yaml_content parses the file with the libyaml backed loader when available."""
+        from fabric_cicd._common._check_utils import YAML_LOADER
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"core": {"workspace_id": "test-id"}}))
+
+        with patch("fabric_cicd._common._config_validator.yaml.load", wraps=yaml.load) as mock_load:
+            result = self.validator._validate_yaml_content(config_file)
+
+        assert result == {"core": {"workspace_id": "test-id"}}
+        assert mock_load.call_args.kwargs["Loader"] is YAML_LOADER
+
     def test_validate_yaml_content_invalid_yaml(self, tmp_path):
         """Test _validate_yaml_content with invalid YAML syntax."""
         config_file = tmp_path / "config.yaml"
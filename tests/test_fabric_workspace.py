@@ -12,6 +12,7 @@ import yaml
 from fixtures.credentials import DummyTokenCredential
 
 from fabric_cicd import configure_fabric_fqdn
+from fabric_cicd._common._item import Item
 from fabric_cicd.fabric_workspace import FabricWorkspace, constants
 
 
@@ -1213,6 +1214,25 @@ def test_resolve_workspace_name(patched_fabric_workspace, valid_workspace_id, te
     assert result == "My Workspace [DEV]"
 
 
+def test_resolve_workspace_name_cached(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+    """Tests _resolve_workspace_name only calls the workspace API once per workspace object."""
+    mock_endpoint = MagicMock()
+    mock_endpoint.invoke.return_value = {"body": {"id": "mock-workspace-id", "displayName": "My Workspace [DEV]"}}
+
+    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+        )
+
+    workspace.endpoint = mock_endpoint
+    mock_endpoint.invoke.reset_mock()
+
+    assert workspace._resolve_workspace_name() == "My Workspace [DEV]"
+    assert workspace._resolve_workspace_name() == "My Workspace [DEV]"
+    assert mock_endpoint.invoke.call_count == 1
+
+
 def test_resolve_workspace_name_not_found(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
     """Tests _resolve_workspace_name raises InputError when displayName not in response."""
     from fabric_cicd._common._exceptions import InputError
@@ -1292,6 +1312,32 @@ def test_lookup_item_attribute(patched_fabric_workspace, valid_workspace_id, tem
         assert "Test Item" in str(exc_info.value)
 
 
+def test_lookup_item_attribute_lists_workspace_items_once(
+    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir
+):
+    """Test that workspace items are listed once per workspace and listed again only on a lookup miss."""
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id, repository_directory=str(temp_workspace_dir), item_type_in_scope=["Notebook"]
+    )
+    workspace.endpoint = MagicMock()
+    workspace.endpoint.invoke.return_value = {
+        "body": {"value": [{"id": "item-id-1234", "type": "Notebook", "displayName": "Test Notebook"}]}
+    }
+
+    for _ in range(3):
+        assert workspace._lookup_item_attribute("target-workspace-id", "Notebook", "Test Notebook", "id") == (
+            "item-id-1234"
+        )
+    assert workspace.endpoint.invoke.call_count == 1
+
+    # An item created after the listing is found by listing the workspace items again
+    workspace.endpoint.invoke.return_value = {
+        "body": {"value": [{"id": "item-id-5678", "type": "Notebook", "displayName": "New Notebook"}]}
+    }
+    assert workspace._lookup_item_attribute("target-workspace-id", "Notebook", "New Notebook", "id") == "item-id-5678"
+    assert workspace.endpoint.invoke.call_count == 2
+
+
 def test_kqldatabase_folder_regex_root_eventhouse():
     """KQLDatabase under top-level Eventhouse .children: group(1) is empty string."""
     pattern = re.compile(constants.KQL_DATABASE_FOLDER_PATH_REGEX)
@@ -1985,6 +2031,9 @@ def test_publish_variable_library_only_calls_replace_parameters(
         mock_logical.assert_not_called()
         mock_ws.assert_not_called()
 
+    # Variable Library files are kept for value set activation
+    assert mock_file.contents is not None
+
 
 def test_publish_non_variable_library_calls_all_replacements(
     temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
@@ -2025,6 +2074,36 @@ def test_publish_non_variable_library_calls_all_replacements(
         mock_params.assert_called_once()
         mock_ws.assert_called_once()
 
+    # Text contents are released once the base64 part is built
+    assert mock_file.contents is None
+
+
+@pytest.mark.parametrize(("deployed_description", "expect_patch"), [("Same", False), ("Old", True)])
+def test_publish_shell_only_item_skips_unchanged_metadata_update(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id, deployed_description, expect_patch
+):
+    """Test that shell-only items only issue the metadata PATCH when the deployed description differs."""
+    workspace = patched_fabric_workspace(valid_workspace_id, str(temp_workspace_dir))
+    item_guid = "11111111-1111-1111-1111-111111111111"
+
+    repository_item = Item(type="Lakehouse", name="TestLakehouse", description="Same", guid=item_guid)
+    workspace.repository_items = {"Lakehouse": {"TestLakehouse": repository_item}}
+    workspace.deployed_items = {
+        "Lakehouse": {
+            "TestLakehouse": Item(
+                type="Lakehouse", name="TestLakehouse", description=deployed_description, guid=item_guid
+            )
+        }
+    }
+
+    with patch.object(workspace.endpoint, "invoke", return_value={"body": {}}) as mock_invoke:
+        workspace._publish_item(item_name="TestLakehouse", item_type="Lakehouse", shell_only_publish=True)
+
+    patch_calls = [c for c in mock_invoke.call_args_list if c.kwargs.get("method") == "PATCH"]
+    assert len(patch_calls) == int(expect_patch)
+    if expect_patch:
+        assert patch_calls[0].kwargs["body"] == {"displayName": "TestLakehouse", "description": "Same"}
+
 
 def test_api_root_url_snapshot_is_not_retargeted_by_second_configure_call(
     temp_workspace_dir, patched_fabric_workspace, monkeypatch
@@ -2054,3 +2133,321 @@ def test_api_root_url_snapshot_is_not_retargeted_by_second_configure_call(
     # workspace_a should still use fqdn_a, not fqdn_b
     assert workspace_a._api_root_url == expected_fqdn_a
     assert workspace_a.base_api_url.startswith(expected_fqdn_a)
+
+
+def test_filter_excluded_files_default_pattern_skips_regex():
+    """Test that the default exclude pattern returns the file list untouched without compiling a regex."""
+    files = [MagicMock(relative_path="a.json"), MagicMock(relative_path=".pbi/cache.abf")]
+
+    with patch("fabric_cicd.fabric_workspace.re.compile") as mock_compile:
+        result = FabricWorkspace._filter_excluded_files(files, constants.DEFAULT_EXCLUDE_PATH_REGEX)
+
+    assert result is files
+    mock_compile.assert_not_called()
+
+
+def test_filter_excluded_files_applies_exclude_pattern():
+    """Test that a custom exclude pattern filters matching files once up front."""
+    files = [MagicMock(relative_path="a.json"), MagicMock(relative_path=".pbi/cache.abf")]
+
+    result = FabricWorkspace._filter_excluded_files(files, constants.EXCLUDE_PATH_REGEX_MAPPING["Report"])
+
+    assert [file.relative_path for file in result] == ["a.json"]
+
+
+def test_refresh_repository_items_reuses_unchanged_platform_metadata(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that unchanged .platform files are parsed once and modified files are parsed again."""
+    item_dir = temp_workspace_dir / "Cached.Notebook"
+    item_dir.mkdir(parents=True, exist_ok=True)
+    platform_file_path = item_dir / ".platform"
+    metadata_content = {
+        "metadata": {"type": "Notebook", "displayName": "Cached"},
+        "config": {"logicalId": "cached-logical-id"},
+    }
+    platform_file_path.write_text(json.dumps(metadata_content), encoding="utf-8")
+
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id, repository_directory=str(temp_workspace_dir), item_type_in_scope=["Notebook"]
+    )
+
+    with patch("fabric_cicd.fabric_workspace.json.loads", wraps=json.loads) as mock_loads:
+        workspace._refresh_repository_items()
+        mock_loads.assert_not_called()
+
+        metadata_content["metadata"]["displayName"] = "Cached Renamed"
+        platform_file_path.write_text(json.dumps(metadata_content), encoding="utf-8")
+        workspace._refresh_repository_items()
+        mock_loads.assert_called_once()
+
+    assert list(workspace.repository_items["Notebook"]) == ["Cached Renamed"]
+
+
+def test_refresh_repository_items_collects_files_for_every_item(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that item files are collected for all items once the repository scan completes."""
+    for index in range(5):
+        item_dir = temp_workspace_dir / f"Notebook {index}.Notebook"
+        item_dir.mkdir(parents=True, exist_ok=True)
+        metadata_content = {
+            "metadata": {"type": "Notebook", "displayName": f"Notebook {index}"},
+            "config": {"logicalId": f"logical-id-{index}"},
+        }
+        (item_dir / ".platform").write_text(json.dumps(metadata_content), encoding="utf-8")
+        (item_dir / "notebook-content.py").write_text(f"print({index})", encoding="utf-8")
+
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id, repository_directory=str(temp_workspace_dir), item_type_in_scope=["Notebook"]
+    )
+
+    for index in range(5):
+        item = workspace.repository_items["Notebook"][f"Notebook {index}"]
+        contents = {file.name: file.contents for file in item.item_files}
+        assert contents["notebook-content.py"] == f"print({index})"
+
+
+def test_refresh_repository_items_if_changed_reuses_scan_of_same_directory(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that the repository is only scanned again once the repository directory changes."""
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id, repository_directory=str(temp_workspace_dir), item_type_in_scope=["Notebook"]
+    )
+
+    with patch.object(workspace, "_refresh_repository_items", wraps=workspace._refresh_repository_items) as mock_scan:
+        workspace._refresh_repository_items_if_changed()
+        mock_scan.assert_not_called()
+
+        other_directory = temp_workspace_dir / "other"
+        other_directory.mkdir()
+        workspace.repository_directory = other_directory
+        workspace._refresh_repository_items_if_changed()
+        workspace._refresh_repository_items_if_changed()
+        mock_scan.assert_called_once()
+
+
+def test_replace_logical_ids_single_pass_and_undeployed_reference(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that all logical IDs are replaced in one pass and undeployed references raise an error."""
+    from fabric_cicd._common._exceptions import ParsingError
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    workspace.repository_items = {
+        "Notebook": {
+            "Short": Item(type="Notebook", name="Short", description="", guid="guid-short", logical_id="logical-1"),
+            "Long": Item(type="Notebook", name="Long", description="", guid="guid-long", logical_id="logical-10"),
+            "New": Item(type="Notebook", name="New", description="", guid="", logical_id="logical-new"),
+        }
+    }
+
+    result = workspace._replace_logical_ids('{"a": "logical-1", "b": "logical-10"}')
+    assert result == '{"a": "guid-short", "b": "guid-long"}'
+
+    with pytest.raises(ParsingError, match="logical-new"):
+        workspace._replace_logical_ids('{"a": "logical-new"}')
+
+    # GUIDs assigned after the index is built (e.g. on item creation) are used
+    workspace.repository_items["Notebook"]["New"].guid = "guid-new"
+    assert workspace._replace_logical_ids('{"a": "logical-new"}') == '{"a": "guid-new"}'
+
+
+def test_replace_parameters_resolves_filters_once_per_parameter_file(
+    patched_fabric_workspace, temp_workspace_dir, valid_workspace_id
+):
+    """Test that file path filters are resolved once and reused across repository files."""
+    parameter_content = """
+find_replace:
+    - find_value: "old-value"
+      replace_value:
+        PPE: "new-value"
+      file_path: "**/notebook-content.py"
+"""
+    notebook_dir = temp_workspace_dir / "Test Notebook.Notebook"
+    notebook_dir.mkdir(parents=True)
+    (temp_workspace_dir / "parameter.yml").write_text(parameter_content)
+    (notebook_dir / "notebook-content.py").write_text('value = "old-value"')
+    (notebook_dir / "other.py").write_text('value = "old-value"')
+
+    from fabric_cicd._common._file import File
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+
+    test_item = Item(type="Notebook", name="Test Notebook", description="", guid="test-guid", path=notebook_dir)
+    notebook_file = File(item_path=notebook_dir, file_path=(notebook_dir / "notebook-content.py").resolve())
+    other_file = File(item_path=notebook_dir, file_path=(notebook_dir / "other.py").resolve())
+
+    with patch(
+        "fabric_cicd._parameter._utils.process_input_path", return_value=[notebook_file.file_path]
+    ) as mock_process:
+        assert workspace._replace_parameters(notebook_file, test_item) == 'value = "new-value"'
+        assert workspace._replace_parameters(other_file, test_item) == 'value = "old-value"'
+
+    mock_process.assert_called_once()
+
+
+def test_replace_find_replace_prefilter_skips_files_without_find_values(
+    patched_fabric_workspace, temp_workspace_dir, valid_workspace_id
+):
+    """Test that files containing none of the plain find values are skipped with a single prefilter scan."""
+    from fabric_cicd._parameter._utils import extract_find_value
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+            environment="PPE",
+        )
+    workspace.environment_parameter = {
+        "find_replace": [
+            {"find_value": "old-value", "replace_value": {"PPE": "new-value"}},
+            {"find_value": "Old-Server", "replace_value": {"PPE": "new-server"}, "ignore_case": "true"},
+        ]
+    }
+
+    with patch("fabric_cicd._parameter._utils.extract_find_value", wraps=extract_find_value) as mock_find:
+        assert workspace._replace_find_replace_parameters("nothing here", "Notebook", "A", Path("a.py")) == (
+            "nothing here"
+        )
+        mock_find.assert_not_called()
+
+        assert (
+            workspace._replace_find_replace_parameters("old-value on OLD-SERVER", "Notebook", "A", Path("a.py"))
+            == "new-value on new-server"
+        )
+        assert mock_find.call_count == 2
+
+    # Regex entries are always processed, and plain entries are re-checked after a regex entry changes the content
+    workspace.environment_parameter = {
+        "find_replace": [
+            {"find_value": r"id=(\d+)", "replace_value": {"PPE": "old-value"}, "is_regex": "true"},
+            {"find_value": "old-value", "replace_value": {"PPE": "new-value"}},
+            {"find_value": "unused", "replace_value": {"PPE": "other"}},
+        ]
+    }
+    with patch("fabric_cicd._parameter._utils.extract_find_value", wraps=extract_find_value) as mock_find:
+        assert workspace._replace_find_replace_parameters("id=42", "Notebook", "A", Path("a.py")) == "id=new-value"
+        # "unused" is skipped once the content no longer contains any plain find value
+        assert mock_find.call_count == 2
+
+        mock_find.reset_mock()
+        assert workspace._replace_find_replace_parameters("no ids", "Notebook", "A", Path("a.py")) == "no ids"
+        assert mock_find.call_count == 1
+
+
+def test_convert_lookups_use_index_rebuilt_on_refresh(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+    """Test that ID and path lookups resolve through indexes that follow repository/deployed item refreshes."""
+    from fabric_cicd._common._item import Item
+
+    with patch.object(FabricWorkspace, "_refresh_repository_items"):
+        workspace = patched_fabric_workspace(
+            workspace_id=valid_workspace_id,
+            repository_directory=str(temp_workspace_dir),
+            item_type_in_scope=["Notebook"],
+        )
+
+    notebook_path = temp_workspace_dir / "A.Notebook"
+    workspace.repository_items = {
+        "Notebook": {
+            "A": Item(type="Notebook", name="A", description="", guid="", logical_id="logical-a", path=notebook_path)
+        }
+    }
+    workspace.deployed_items = {"Notebook": {"A": Item(type="Notebook", name="A", description="", guid="guid-a")}}
+
+    assert workspace._convert_id_to_name("Notebook", "logical-a", "Repository") == "A"
+    assert workspace._convert_id_to_name("Notebook", "guid-a", "Deployed") == "A"
+    assert workspace._convert_id_to_name("Notebook", "missing", "Deployed") is None
+    with pytest.raises(KeyError):
+        workspace._convert_id_to_name("Report", "guid-a", "Deployed")
+    assert workspace._convert_path_to_id("Notebook", str(notebook_path)) == "logical-a"
+    assert workspace._convert_path_to_id("Report", str(notebook_path)) is None
+
+    # Refresh replaces the deployed items dictionary, so the index is rebuilt
+    workspace.deployed_items = {"Notebook": {"B": Item(type="Notebook", name="B", description="", guid="guid-b")}}
+    assert workspace._convert_id_to_name("Notebook", "guid-b", "Deployed") == "B"
+    assert workspace._convert_id_to_name("Notebook", "guid-a", "Deployed") is None
+
+
+def test_collect_item_files_skips_excluded_files_before_reading(tmp_path):
+    """Test that files matching the exclusion regex are not read or added to the item files."""
+    from fabric_cicd._common._file import File
+
+    item_path = tmp_path / "Sales.Report"
+    (item_path / ".pbi").mkdir(parents=True)
+    (item_path / "definition.pbir").write_text("{}")
+    (item_path / ".pbi" / "localSettings.json").write_text("{}")
+
+    item = Item(type="Report", name="Sales", description="", guid="", path=item_path)
+    with patch("fabric_cicd._common._item.File", wraps=File) as mock_file:
+        item.collect_item_files(constants.EXCLUDE_PATH_REGEX_MAPPING["Report"])
+
+    assert [file.relative_path for file in item.item_files] == ["definition.pbir"]
+    assert mock_file.call_count == 1
+
+    item.collect_item_files()
+    assert sorted(file.relative_path for file in item.item_files) == [".pbi/localSettings.json", "definition.pbir"]
+
+
+def test_refresh_deployed_items_if_changed_skips_unchanged_workspace(
+    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir
+):
+    """Test that deployed items are only listed again after the deployment changed the workspace items."""
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id, repository_directory=str(temp_workspace_dir), item_type_in_scope=["Notebook"]
+    )
+    workspace.endpoint = MagicMock()
+    workspace.endpoint.invoke.return_value = {
+        "body": {"value": [{"id": "guid-a", "type": "Notebook", "displayName": "A", "description": ""}]}
+    }
+
+    workspace._refresh_deployed_items_if_changed()
+    workspace._refresh_deployed_items_if_changed()
+    assert workspace.endpoint.invoke.call_count == 1
+    assert workspace.deployed_items["Notebook"]["A"].guid == "guid-a"
+
+    # Deleting an item changes the deployed items, so the next call lists them again
+    workspace._unpublish_item(item_name="A", item_type="Notebook")
+    workspace.endpoint.invoke.reset_mock()
+    workspace._refresh_deployed_items_if_changed()
+    workspace._refresh_deployed_items_if_changed()
+    workspace.endpoint.invoke.assert_called_once_with(method="GET", url=f"{workspace.base_api_url}/items")
+
+
+def test_refresh_deployed_items_and_folders_refreshes_both(
+    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir
+):
+    """Tests _refresh_deployed_items_and_folders refreshes deployed items and folders and raises their errors."""
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+    )
+
+    with (
+        patch.object(workspace, "_refresh_deployed_items") as mock_items,
+        patch.object(workspace, "_refresh_deployed_folders") as mock_folders,
+    ):
+        workspace._refresh_deployed_items_and_folders()
+
+        mock_items.assert_called_once_with()
+        mock_folders.assert_called_once_with()
+
+        mock_folders.side_effect = RuntimeError("folders failed")
+        with pytest.raises(RuntimeError, match="folders failed"):
+            workspace._refresh_deployed_items_and_folders()
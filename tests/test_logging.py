@@ -637,6 +637,16 @@ class TestLogHeader:
         assert len(caplog.records) >= 3
         assert any("Test Header" in record.message for record in caplog.records)
 
+    def test_skips_header_when_info_disabled(self):
+        """Test log_header does not log anything when the logger does not emit info messages."""
+        logger = logging.getLogger("fabric_cicd.test_quiet")
+        logger.setLevel(logging.WARNING)
+
+        with patch.object(logger, "info") as mock_info:
+            log_header(logger, "Test Header")
+
+        mock_info.assert_not_called()
+
 
 class TestWrapperFunctions:
     """Tests for the wrapper functions in __init__.py."""
@@ -836,6 +836,21 @@ find_replace:
         Path(temp_file_path).unlink()
 
 
+def test_fast_yaml_loader_detects_duplicate_keys():
+    """Test that the libyaml backed loader (when available) detects duplicate keys like _DuplicateKeyLoader."""
+    from fabric_cicd._parameter._parameter import _FastDuplicateKeyLoader, _load_yaml_with_duplicate_check
+
+    content = "find_replace:\n  - find_value: a\nFIND_REPLACE: []\n"
+    with pytest.raises(yaml.YAMLError, match="find_replace"):
+        yaml.load(content, Loader=_FastDuplicateKeyLoader)
+    with pytest.raises(yaml.YAMLError, match="find_replace"):
+        _load_yaml_with_duplicate_check(content)
+
+    assert _load_yaml_with_duplicate_check("find_replace:\n  - find_value: a\n") == {
+        "find_replace": [{"find_value": "a"}]
+    }
+
+
 def test_duplicate_keys_single_duplicate(repository_directory, item_type_in_scope, target_environment):
     """Test detection of a single duplicate root-level key via _DuplicateKeyLoader."""
     param_obj = Parameter(
@@ -1891,6 +1906,22 @@ def test_validate_parameter_file_exists_none():
         assert param._validate_parameter_file_exists() is False
 
 
+def test_refresh_parameter_file_skips_missing_or_directory_path(tmp_path):
+    """Test that a missing parameter file or a directory path loads an empty parameter dict without raising."""
+    (tmp_path / "param_dir").mkdir()
+
+    for file_name in ["does_not_exist.yml", "param_dir"]:
+        param = Parameter(
+            repository_directory=tmp_path,
+            item_type_in_scope=["Notebook"],
+            environment="TEST",
+            parameter_file_name=file_name,
+        )
+
+        assert param.environment_parameter == {}
+        assert param._validate_parameter_load() == (False, "not found")
+
+
 def test_parameter_file_path_invalid_type():
     """Test that Parameter class handles invalid types for parameter_file_path."""
     import tempfile
@@ -62,6 +62,7 @@ from fabric_cicd._parameter._utils import (
     extract_parameter_filters,
     extract_replace_value,
     is_valid_structure,
+    parse_jsonpath,
     process_environment_key,
     process_input_path,
     replace_key_value,
@@ -133,6 +134,15 @@ class TestParameterUtilities:
         expected_no_match = {"pattern": "test-value", "is_regex": False, "has_matches": False, "ignore_case": False}
         assert extract_find_value(param_dict, "unrelated content", True) == expected_no_match
 
+    def test_extract_find_value_ignore_case(self):
+        """Tests extract_find_value with a case-insensitive plain text find value."""
+        param_dict = {"find_value": "Test.Value", "ignore_case": "true"}
+        expected = {"pattern": "Test.Value", "is_regex": False, "has_matches": True, "ignore_case": True}
+        assert extract_find_value(param_dict, "content with TEST.VALUE", True) == expected
+        # Special characters are matched literally
+        expected_no_match = {"pattern": "Test.Value", "is_regex": False, "has_matches": False, "ignore_case": True}
+        assert extract_find_value(param_dict, "content with test-value", True) == expected_no_match
+
     def test_extract_find_value_valid_regex(self):
         """Tests extract_find_value with regex pattern."""
         param_dict = {"find_value": "id=([\\w-]+)", "is_regex": "true"}
@@ -1027,6 +1037,25 @@ class TestParameterUtilities:
         with pytest.raises(ValueError, match="Expecting property name"):
             replace_key_value(mock_workspace, param_dict, "{invalid json}", "dev")
 
+    def test_replace_key_value_reuses_parsed_jsonpath(self, mock_workspace):
+        """Test that a find_key is parsed once and the parsed expression is reused across files."""
+        param_dict = {
+            "find_key": "$.connections[?(@.name=='main')].id",
+            "replace_value": {"dev": "dev-id"},
+        }
+        parse_jsonpath.cache_clear()
+
+        for content in [
+            '{"connections": [{"name": "main", "id": "a"}]}',
+            '{"connections": [{"name": "main", "id": "b"}]}',
+        ]:
+            result = replace_key_value(mock_workspace, param_dict, content, "dev")
+            assert json.loads(result)["connections"][0]["id"] == "dev-id"
+
+        cache_info = parse_jsonpath.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 1)
+        assert parse_jsonpath(param_dict["find_key"]) is parse_jsonpath(param_dict["find_key"])
+
     def test_replace_key_value_with_items_notation(self, mock_workspace):
         """Test replace_key_value function with $items notation."""
         # Mock the workspace to return item attributes
@@ -3,9 +3,13 @@
 
 """Test publishing functionality including selective publishing based on repository content."""
 
+import base64
 import json
 import logging
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from unittest.mock import MagicMock, patch
@@ -513,6 +517,21 @@ def test_unpublish_orphan_excluded_by_regex(mock_endpoint, temp_workspace_dir):
         assert ("ProtectedOrphan", "Notebook") not in unpublish_calls
 
 
+def test_get_orphaned_items_skips_default_exclude_regex():
+    """Test that the default '^$' exclude pattern returns every orphan without compiling a regex."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    workspace = MagicMock()
+    workspace.deployed_items = {"Notebook": {"KeepMe": MagicMock(), "OrphanA": MagicMock(), "OrphanB": MagicMock()}}
+    workspace.repository_items = {"Notebook": {"KeepMe": MagicMock()}}
+
+    with patch("re.compile") as mock_compile:
+        orphans = ItemPublisher.get_orphaned_items(workspace, "Notebook", item_name_exclude_regex="^$")
+
+    assert orphans == ["OrphanA", "OrphanB"]
+    mock_compile.assert_not_called()
+
+
 @pytest.mark.usefixtures("experimental_feature_flags")
 def test_unpublish_orphan_filtered_by_items_to_include(mock_endpoint, temp_workspace_dir):
     """Test that items_to_include limits which orphaned items are unpublished."""
@@ -1196,3 +1215,546 @@ def test_empty_items_to_include_skips_environment_publish_state_checks(mock_endp
         # All environment items should be marked as skip_publish
         assert workspace.repository_items["Environment"]["EnvA"].skip_publish is True
         assert workspace.repository_items["Environment"]["EnvB"].skip_publish is True
+
+
+def test_find_referenced_datapipelines_walks_nested_content():
+    """Test that pipeline references are found in nested dicts and lists, in document order, without duplicates."""
+    from fabric_cicd._items._datapipeline import find_referenced_datapipelines
+
+    names_by_id = {
+        "11111111-1111-1111-1111-111111111111": "Child A",
+        "22222222-2222-2222-2222-222222222222": "Child B",
+    }
+    workspace = MagicMock()
+    workspace._convert_id_to_name.side_effect = lambda generic_id, **_kwargs: names_by_id.get(generic_id)
+
+    file_content = {
+        "properties": {
+            "activities": [
+                {"type": "ExecutePipeline", "typeProperties": {"pipelineId": "22222222-2222-2222-2222-222222222222"}},
+                {"type": "InvokePipeline", "typeProperties": {"pipelineId": "11111111-1111-1111-1111-111111111111"}},
+                {"type": "ExecutePipeline", "typeProperties": {"pipelineId": "22222222-2222-2222-2222-222222222222"}},
+                {
+                    "type": "Wait",
+                    "typeProperties": {"waitTimeInSeconds": 1, "id": "33333333-3333-3333-3333-333333333333"},
+                },
+            ]
+        }
+    }
+
+    assert find_referenced_datapipelines(workspace, file_content, "Repository") == ["Child B", "Child A"]
+
+
+def test_find_referenced_datapipelines_only_checks_guid_length_strings():
+    """Test that only strings that can match the anchored GUID pattern are resolved to pipeline names."""
+    from fabric_cicd._items._datapipeline import find_referenced_datapipelines
+
+    workspace = MagicMock()
+    workspace._convert_id_to_name.return_value = "Child"
+
+    file_content = {
+        "name": "Parent",
+        "expression": "@concat('11111111-1111-1111-1111-111111111111', pipeline().RunId)",
+        "pipelineId": "11111111-1111-1111-1111-111111111111\n",
+    }
+
+    assert find_referenced_datapipelines(workspace, file_content, "Repository") == ["Child"]
+    workspace._convert_id_to_name.assert_called_once()
+
+
+def test_kql_replace_cluster_uri_skips_files_without_empty_cluster_uri():
+    """Test that KQL cluster URI replacement only parses and rewrites files with an empty cluster URI."""
+    from fabric_cicd._items._kqlqueryset import replace_cluster_uri
+
+    workspace = MagicMock()
+    workspace.base_api_url = "https://api.fabric.microsoft.com/v1/workspaces/ws"
+    workspace.deployed_items = {"KQLDatabase": {"DB": MagicMock(guid="db-guid")}}
+    workspace.endpoint.invoke.return_value = {"body": {"properties": {"queryServiceUri": "https://cluster.kusto"}}}
+
+    populated = '{"queryset": {"dataSources": [{"clusterUri":"https://existing", "databaseItemName": "DB"}]}}'
+    assert replace_cluster_uri(workspace, MagicMock(contents=populated)) == populated
+    workspace.endpoint.invoke.assert_not_called()
+
+    empty = '{"queryset": {"dataSources": [{"clusterUri" : "", "databaseItemName": "DB"}]}}'
+    result = json.loads(replace_cluster_uri(workspace, MagicMock(contents=empty)))
+    assert result["queryset"]["dataSources"][0]["clusterUri"] == "https://cluster.kusto"
+
+
+def test_kql_dashboard_replace_cluster_uri_fetches_each_database_once():
+    """Test that data sources sharing a KQL Database trigger a single cluster URI lookup."""
+    from fabric_cicd._items._kqldashboard import replace_cluster_uri
+
+    workspace = MagicMock()
+    workspace.base_api_url = "https://api.fabric.microsoft.com/v1/workspaces/ws"
+    workspace.deployed_items = {"KQLDatabase": {"DB": MagicMock(guid="db-guid")}}
+    workspace.endpoint.invoke.return_value = {"body": {"properties": {"queryServiceUri": "https://cluster.kusto"}}}
+
+    contents = json.dumps({"dataSources": [{"clusterUri": "", "name": "DB"}, {"clusterUri": "", "name": "DB"}]})
+    result = json.loads(replace_cluster_uri(workspace, MagicMock(contents=contents)))
+
+    assert [source["clusterUri"] for source in result["dataSources"]] == ["https://cluster.kusto"] * 2
+    workspace.endpoint.invoke.assert_called_once()
+
+
+def test_kql_dashboard_replace_cluster_uri_keeps_file_when_no_data_source_changes():
+    """Test that the file is returned verbatim when the empty cluster URI is not on a data source."""
+    from fabric_cicd._items._kqldashboard import replace_cluster_uri
+
+    workspace = MagicMock()
+    workspace.deployed_items = {}
+
+    contents = '{"dataSources": [{"clusterUri": "https://existing", "name": "DB"}], "tiles": [{"clusterUri": ""}]}'
+
+    assert replace_cluster_uri(workspace, MagicMock(contents=contents)) == contents
+    workspace.endpoint.invoke.assert_not_called()
+
+
+def test_get_source_dataflow_name_reuses_resolved_parameter_entries():
+    """Test that source dataflow lookup reuses resolved parameter filters and validates every find value."""
+    from fabric_cicd._items import _dataflowgen2
+
+    workspace_id = "11111111-1111-1111-1111-111111111111"
+    dataflow_id = "22222222-2222-2222-2222-222222222222"
+    file_content = f'PowerPlatform.Dataflows([])\nworkspaceId = "{workspace_id}"\ndataflowId = "{dataflow_id}"'
+    matching_param = {"find_value": dataflow_id, "replace_value": {"PPE": "$items.Dataflow.Source.$id"}}
+    workspace = MagicMock(environment="PPE")
+    workspace._get_parameter_entries.return_value = [
+        ({"find_value": "other-value", "replace_value": {"PPE": "x"}}, (None, None, None)),
+        (matching_param, (None, None, None)),
+    ]
+
+    with (
+        patch.object(_dataflowgen2, "extract_replace_value", return_value="Source") as mock_replace,
+        patch.object(
+            _dataflowgen2, "extract_find_value", side_effect=lambda param, *_: {"pattern": param["find_value"]}
+        ) as mock_find,
+    ):
+        result = _dataflowgen2.get_source_dataflow_name(workspace, file_content, "Target", "Target/mashup.pq")
+
+    assert result == ("Source", workspace_id, dataflow_id)
+    workspace._get_parameter_entries.assert_called_once_with("find_replace")
+    assert mock_find.call_count == 2
+    assert mock_find.call_args[0][0] is matching_param
+    mock_replace.assert_called_once_with(workspace, "$items.Dataflow.Source.$id", get_dataflow_name=True)
+
+
+def test_set_publish_levels_groups_items_by_dependency_depth(tmp_path):
+    """Test that items are grouped into levels that only reference items of earlier levels."""
+    from fabric_cicd._items._manage_dependencies import set_publish_levels
+
+    references = {"A": [], "B": [], "C": ["A", "B"], "D": ["C"], "E": ["A"]}
+    workspace = MagicMock()
+    workspace.repository_items = {"DataPipeline": {}}
+    for name, refs in references.items():
+        item_path = tmp_path / f"{name}.DataPipeline"
+        item_path.mkdir()
+        (item_path / "pipeline-content.json").write_text(json.dumps({"refs": refs}), encoding="utf-8")
+        workspace.repository_items["DataPipeline"][name] = MagicMock(path=item_path)
+
+    levels = set_publish_levels(workspace, "DataPipeline", lambda _ws, content, _lookup: content["refs"])
+
+    assert [sorted(level) for level in levels] == [["A", "B"], ["C", "E"], ["D"]]
+
+
+def test_set_unpublish_order_fetches_deployed_definitions():
+    """Test that deployed definitions are fetched per item and dependents are unpublished first."""
+    from fabric_cicd._items._manage_dependencies import set_unpublish_order
+
+    references = {"A": [], "B": ["A"], "C": ["B"]}
+    workspace = MagicMock()
+    workspace.base_api_url = "https://api.example/workspaces/ws"
+    workspace.deployed_items = {"DataPipeline": {name: MagicMock(guid=f"guid-{name}") for name in references}}
+
+    def invoke(url, **_kwargs):
+        name = url.split("/items/guid-")[1].split("/")[0]
+        payload = base64.b64encode(json.dumps({"refs": references[name]}).encode("utf-8")).decode("utf-8")
+        return {"body": {"definition": {"parts": [{"path": "pipeline-content.json", "payload": payload}]}}}
+
+    workspace.endpoint.invoke.side_effect = invoke
+
+    order = set_unpublish_order(
+        workspace, "DataPipeline", ["A", "B", "C"], lambda _ws, content, _lookup: content["refs"]
+    )
+
+    assert order == ["C", "B", "A"]
+    assert workspace.endpoint.invoke.call_count == 3
+
+
+def test_publish_items_by_level_publishes_levels_in_order():
+    """Test that each level is fully published before the next one starts."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    published = []
+
+    class _Publisher(ItemPublisher):
+        item_type = "DataPipeline"
+
+        def publish_one(self, item_name, _item):
+            published.append(item_name)
+
+    publisher = _Publisher(MagicMock())
+    items = {name: MagicMock() for name in ["A", "B", "C", "D"]}
+
+    errors = publisher._publish_items_by_level(items, [["A", "B"], ["C"], ["D", "Skipped"]])
+
+    assert errors == []
+    assert sorted(published[:2]) == ["A", "B"]
+    assert published[2:] == ["C", "D"]
+
+
+def test_unpublish_all_deletes_independent_items_in_parallel():
+    """Test that items without dependency tracking are all unpublished through the executor."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    class _Publisher(ItemPublisher):
+        item_type = "Notebook"
+
+        def publish_one(self, _item_name, _item):
+            pass
+
+    workspace = MagicMock()
+    publisher = _Publisher(workspace)
+
+    with patch("fabric_cicd._items._base_publisher.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_executor:
+        publisher.unpublish_all(["A", "B", "C"])
+
+    mock_executor.assert_called_once()
+    unpublished = sorted(call.kwargs["item_name"] for call in workspace._unpublish_item.call_args_list)
+    assert unpublished == ["A", "B", "C"]
+
+
+def test_unpublish_all_keeps_dependency_order():
+    """Test that publishers with dependency tracking unpublish sequentially in dependency order."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    class _Publisher(ItemPublisher):
+        item_type = "DataPipeline"
+        has_dependency_tracking = True
+
+        def publish_one(self, _item_name, _item):
+            pass
+
+        def get_unpublish_order(self, items_to_unpublish):
+            return list(reversed(items_to_unpublish))
+
+    workspace = MagicMock()
+    publisher = _Publisher(workspace)
+
+    with patch("fabric_cicd._items._base_publisher.ThreadPoolExecutor") as mock_executor:
+        publisher.unpublish_all(["A", "B", "C"])
+
+    mock_executor.assert_not_called()
+    assert [call.kwargs["item_name"] for call in workspace._unpublish_item.call_args_list] == ["C", "B", "A"]
+
+
+def test_unpublish_all_deletes_each_unpublish_level_in_parallel():
+    """Test that a level is fully unpublished before the next one, with multi-item levels through the executor."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    class _Publisher(ItemPublisher):
+        item_type = "DataPipeline"
+        has_dependency_tracking = True
+
+        def publish_one(self, _item_name, _item):
+            pass
+
+        def get_unpublish_levels(self, _items_to_unpublish):
+            return [["C", "D"], ["B"], ["A"]]
+
+    workspace = MagicMock()
+    publisher = _Publisher(workspace)
+
+    with patch("fabric_cicd._items._base_publisher.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_executor:
+        publisher.unpublish_all(["A", "B", "C", "D"])
+
+    mock_executor.assert_called_once()
+    unpublished = [call.kwargs["item_name"] for call in workspace._unpublish_item.call_args_list]
+    assert sorted(unpublished[:2]) == ["C", "D"]
+    assert unpublished[2:] == ["B", "A"]
+
+
+def test_set_unpublish_levels_groups_items_by_referencing_depth():
+    """Test that items are only unpublished after every item to unpublish that references them."""
+    from fabric_cicd._items._manage_dependencies import set_unpublish_levels
+
+    references = {"A": [], "B": ["A"], "C": ["B"], "D": ["A"], "E": []}
+    workspace = MagicMock()
+    workspace.base_api_url = "https://api.example/workspaces/ws"
+    workspace.deployed_items = {"DataPipeline": {name: MagicMock(guid=f"guid-{name}") for name in references}}
+
+    def invoke(url, **_kwargs):
+        name = url.split("/items/guid-")[1].split("/")[0]
+        payload = base64.b64encode(json.dumps({"refs": references[name]}).encode("utf-8")).decode("utf-8")
+        return {"body": {"definition": {"parts": [{"path": "pipeline-content.json", "payload": payload}]}}}
+
+    workspace.endpoint.invoke.side_effect = invoke
+
+    levels = set_unpublish_levels(
+        workspace, "DataPipeline", list(references), lambda _ws, content, _lookup: content["refs"]
+    )
+
+    assert [sorted(level) for level in levels] == [["C", "D", "E"], ["B"], ["A"]]
+
+
+def test_get_item_type_waves_to_publish_follows_serial_publish_order():
+    """Test that the publish waves keep the serial publish order and never group dependent item types."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    workspace = MagicMock()
+    workspace.item_type_in_scope = [item_type.value for item_type in constants.SERIAL_ITEM_PUBLISH_ORDER.values()]
+    workspace.repository_items = {item_type: {} for item_type in workspace.item_type_in_scope}
+
+    waves = ItemPublisher.get_item_type_waves_to_publish(workspace)
+
+    assert [item for wave in waves for item in wave] == list(constants.SERIAL_ITEM_PUBLISH_ORDER.items())
+    for wave in waves:
+        wave_item_types = {item_type for _, item_type in wave}
+        for item_type in wave_item_types:
+            assert wave_item_types.isdisjoint(constants.ITEM_TYPE_PUBLISH_DEPENDENCIES.get(item_type, frozenset()))
+
+
+def test_get_item_type_waves_to_publish_skips_item_types_not_published():
+    """Test that waves only contain item types in scope and in the repository, keeping their order numbers."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    workspace = MagicMock()
+    workspace.item_type_in_scope = ["Notebook", "SemanticModel", "Report", "DataPipeline"]
+    workspace.repository_items = {"Notebook": {}, "SemanticModel": {}, "DataPipeline": {}, "Lakehouse": {}}
+
+    waves = ItemPublisher.get_item_type_waves_to_publish(workspace)
+
+    assert waves == [
+        [(10, ItemType.NOTEBOOK), (11, ItemType.SEMANTIC_MODEL)],
+        [(19, ItemType.DATA_PIPELINE)],
+    ]
+
+
+def test_publish_all_by_wave_publishes_each_item_type():
+    """Test that every item type of every wave is published and async publishers are returned in order."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    workspace = MagicMock()
+    workspace.item_type_in_scope = ["Environment", "Eventhouse", "Notebook"]
+    workspace.repository_items = {"Environment": {}, "Eventhouse": {}, "Notebook": {}}
+
+    publishers = {}
+
+    def create_publisher(item_type, _workspace):
+        publisher = MagicMock(has_async_publish_check=item_type == ItemType.ENVIRONMENT)
+        publishers[item_type] = publisher
+        return publisher
+
+    with patch.object(ItemPublisher, "create", side_effect=create_publisher):
+        async_publishers = ItemPublisher.publish_all_by_wave(workspace)
+
+    assert set(publishers) == {ItemType.ENVIRONMENT, ItemType.EVENTHOUSE, ItemType.NOTEBOOK}
+    for publisher in publishers.values():
+        publisher.publish_all.assert_called_once()
+    assert async_publishers == [publishers[ItemType.ENVIRONMENT]]
+
+
+def test_publish_all_by_wave_raises_failure_before_next_wave():
+    """Test that a failed item type stops publishing before the next wave starts."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+
+    workspace = MagicMock()
+    workspace.item_type_in_scope = ["Notebook", "DataPipeline"]
+    workspace.repository_items = {"Notebook": {}, "DataPipeline": {}}
+
+    pipeline_publisher = MagicMock()
+
+    def create_publisher(item_type, _workspace):
+        if item_type == ItemType.NOTEBOOK:
+            return MagicMock(publish_all=MagicMock(side_effect=RuntimeError("notebook failed")))
+        return pipeline_publisher
+
+    with (
+        patch.object(ItemPublisher, "create", side_effect=create_publisher),
+        pytest.raises(RuntimeError, match="notebook failed"),
+    ):
+        ItemPublisher.publish_all_by_wave(workspace)
+
+    pipeline_publisher.publish_all.assert_not_called()
+
+
+def test_publish_all_by_wave_refreshes_deployed_items_published_in_same_wave(mock_endpoint, temp_workspace_dir):
+    """Test that an item type refreshing the deployed items picks up items published earlier in its own wave."""
+    from fabric_cicd._items._base_publisher import ItemPublisher
+    from fabric_cicd._items._kqldashboard import KQLDashboardPublisher
+
+    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
+        workspace = FabricWorkspace(
+            workspace_id="12345678-1234-5678-abcd-1234567890ab",
+            repository_directory=str(temp_workspace_dir),
+            token_credential=DummyTokenCredential(),
+        )
+    workspace.item_type_in_scope = ["Notebook", "DataPipeline", "KQLDashboard"]
+    workspace.repository_items = {"Notebook": {}, "DataPipeline": {}, "KQLDashboard": {}}
+    workspace._deployed_items_refreshed_version = workspace._deployed_items_version
+
+    refreshes = []
+
+    def refresh_deployed_items():
+        refreshes.append(workspace._deployed_items_version)
+        workspace._deployed_items_refreshed_version = workspace._deployed_items_version
+
+    workspace._refresh_deployed_items = refresh_deployed_items
+    # DataPipeline publishes an item before KQLDashboard refreshes the deployed items in the same wave
+    item_published = threading.Event()
+
+    def publish_item():
+        workspace._deployed_items_version += 1
+
+    def publish_item_in_wave():
+        publish_item()
+        item_published.set()
+
+    def refresh_and_publish():
+        assert item_published.wait(timeout=5)
+        KQLDashboardPublisher(workspace).pre_publish_all()
+
+    publish_all_by_item_type = {
+        ItemType.NOTEBOOK: publish_item,
+        ItemType.DATA_PIPELINE: publish_item_in_wave,
+        ItemType.KQL_DASHBOARD: refresh_and_publish,
+    }
+
+    def create_publisher(item_type, _workspace):
+        return MagicMock(has_async_publish_check=False, publish_all=publish_all_by_item_type[item_type])
+
+    with patch.object(ItemPublisher, "create", side_effect=create_publisher):
+        ItemPublisher.publish_all_by_wave(workspace)
+
+    # Refreshed before the DataPipeline/KQLDashboard wave for the Notebook, then by KQLDashboard for the DataPipeline
+    assert refreshes == [1, 2]
+
+
+def test_refresh_deployed_items_if_changed_refreshes_once_across_threads(mock_endpoint, temp_workspace_dir):
+    """Test that concurrent refresh requests for the same change only refresh the deployed items once."""
+    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
+        workspace = FabricWorkspace(
+            workspace_id="12345678-1234-5678-abcd-1234567890ab",
+            repository_directory=str(temp_workspace_dir),
+            token_credential=DummyTokenCredential(),
+        )
+    workspace._deployed_items_version += 1
+
+    refreshes = []
+
+    def refresh_deployed_items():
+        time.sleep(0.01)
+        refreshes.append(workspace._deployed_items_version)
+        workspace._deployed_items_refreshed_version = workspace._deployed_items_version
+
+    workspace._refresh_deployed_items = refresh_deployed_items
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(4):
+            executor.submit(workspace._refresh_deployed_items_if_changed)
+
+    assert len(refreshes) == 1
+
+
+def test_refresh_deployed_items_keeps_previous_items_until_complete(mock_endpoint, temp_workspace_dir):
+    """Test that readers see the previous deployed items while a refresh is still collecting item attributes."""
+    from fabric_cicd._common._item import Item
+
+    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
+        workspace = FabricWorkspace(
+            workspace_id="12345678-1234-5678-abcd-1234567890ab",
+            repository_directory=str(temp_workspace_dir),
+            token_credential=DummyTokenCredential(),
+        )
+    workspace.contains_param_vars = True
+    workspace.deployed_items = {
+        "Lakehouse": {"Sales": Item(type="Lakehouse", name="Sales", description="", guid="previous-guid")}
+    }
+    mock_endpoint.invoke.side_effect = lambda **_kwargs: {
+        "body": {"value": [{"type": "Lakehouse", "description": "", "displayName": "Sales", "id": "refreshed-guid"}]}
+    }
+
+    guids_seen_during_refresh = []
+
+    def get_item_attribute(*_args):
+        guids_seen_during_refresh.append(workspace.deployed_items["Lakehouse"]["Sales"].guid)
+        return "attribute"
+
+    with patch.object(workspace, "_get_item_attribute", side_effect=get_item_attribute):
+        workspace._refresh_deployed_items()
+
+    assert guids_seen_during_refresh == ["previous-guid", "previous-guid"]
+    assert workspace.deployed_items["Lakehouse"]["Sales"].guid == "refreshed-guid"
+    assert workspace.workspace_items["Lakehouse"]["Sales"]["sqlendpoint"] == "attribute"
+
+
+def test_parallel_item_type_publish_requires_experimental_flag(mock_endpoint, temp_workspace_dir):
+    """Test that parallel item type publish without enable_experimental_features raises InputError."""
+    original_flags = constants.FEATURE_FLAG.copy()
+    constants.FEATURE_FLAG.add("enable_parallel_item_type_publish")
+    try:
+        with (
+            patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint),
+            patch.object(
+                FabricWorkspace, "_refresh_deployed_items", new=lambda self: setattr(self, "deployed_items", {})
+            ),
+        ):
+            workspace = FabricWorkspace(
+                workspace_id="12345678-1234-5678-abcd-1234567890ab",
+                repository_directory=str(temp_workspace_dir),
+                token_credential=DummyTokenCredential(),
+            )
+
+            with pytest.raises(InputError, match="requires 'enable_experimental_features'"):
+                publish.publish_all_items(workspace)
+    finally:
+        constants.FEATURE_FLAG.clear()
+        constants.FEATURE_FLAG.update(original_flags)
+
+
+def test_unpublish_all_orphan_items_reuses_repository_scan():
+    """Test that the repository is only scanned if not scanned already, while deployed items are still listed again."""
+    workspace = MagicMock(spec=FabricWorkspace)
+    workspace.item_type_in_scope = []
+    workspace.deployed_items = {}
+    workspace.repository_items = {}
+    workspace.unpublish_responses = None
+
+    publish.unpublish_all_orphan_items(workspace)
+    workspace._refresh_deployed_items.assert_called_once()
+    workspace._refresh_repository_items_if_changed.assert_called_once()
+    workspace._refresh_repository_items.assert_not_called()
+
+
+def test_unpublish_all_orphan_items_skips_deployed_items_refresh_without_orphans():
+    """Test that deployed items are only listed again after unpublishing when orphaned items were unpublished."""
+    workspace = MagicMock(spec=FabricWorkspace)
+    workspace.item_type_in_scope = ["Notebook"]
+    workspace.deployed_items = {"Notebook": {"KeepMe": MagicMock()}}
+    workspace.repository_items = {"Notebook": {"KeepMe": MagicMock()}}
+    workspace.unpublish_responses = None
+
+    publish.unpublish_all_orphan_items(workspace)
+    workspace._refresh_deployed_items_and_folders.assert_not_called()
+    workspace._refresh_deployed_folders.assert_called_once()
+
+    workspace.deployed_items = {"Notebook": {"KeepMe": MagicMock(), "Orphan": MagicMock()}}
+    publish.unpublish_all_orphan_items(workspace)
+    workspace._unpublish_item.assert_called_once_with(item_name="Orphan", item_type="Notebook")
+    workspace._refresh_deployed_items_and_folders.assert_called_once()
+
+
+def test_publish_all_items_validates_inputs_before_any_api_call():
+    """Test that invalid inputs are rejected before the workspace is queried or any listing is refreshed."""
+    workspace = MagicMock(spec=FabricWorkspace)
+    workspace.endpoint = MagicMock()
+
+    with (
+        patch.object(publish, "validate_fabric_workspace_obj", side_effect=lambda ws: ws),
+        patch.object(constants, "FEATURE_FLAG", set()),
+        pytest.raises(InputError, match="enable_shortcut_exclude"),
+    ):
+        publish.publish_all_items(workspace, shortcut_exclude_regex="^temp_")
+
+    workspace.endpoint.invoke.assert_not_called()
+    workspace._refresh_deployed_items.assert_not_called()
+    workspace._refresh_deployed_items_and_folders.assert_not_called()
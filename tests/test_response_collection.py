@@ -242,6 +242,41 @@ def test_publish_item_skipped_no_response_stored(test_workspace_with_notebook):
         constants.FEATURE_FLAG.discard("enable_response_collection")
 
 
+def test_publish_item_unchanged_shell_only_item_response_stored(test_workspace_with_notebook, mock_endpoint):
+    """Test that a shell-only item whose deployed metadata is unchanged is still updated when collecting responses."""
+    from fabric_cicd._common._item import Item
+
+    workspace = test_workspace_with_notebook
+
+    constants.FEATURE_FLAG.add("enable_response_collection")
+
+    try:
+        workspace.responses = {}
+        workspace.repository_items = {
+            "Lakehouse": {
+                "TestLakehouse": Item(
+                    type="Lakehouse", name="TestLakehouse", description="Sales", guid="lakehouse-guid", folder_id=""
+                )
+            }
+        }
+        workspace.deployed_items = {
+            "Lakehouse": {
+                "TestLakehouse": Item(
+                    type="Lakehouse", name="TestLakehouse", description="Sales", guid="lakehouse-guid", folder_id=""
+                )
+            }
+        }
+        mock_endpoint.invoke.reset_mock()
+
+        workspace._publish_item(item_name="TestLakehouse", item_type="Lakehouse")
+
+        assert mock_endpoint.invoke.call_args.kwargs["method"] == "PATCH"
+        response = workspace.responses["Lakehouse"]["TestLakehouse"]
+        assert response["body"]["message"] == "Item metadata updated successfully"
+    finally:
+        constants.FEATURE_FLAG.discard("enable_response_collection")
+
+
 def test_append_feature_flag_enables_response_collection(test_workspace_with_notebook):
     """Test that using append_feature_flag enables response collection."""
     workspace = test_workspace_with_notebook
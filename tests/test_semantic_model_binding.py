@@ -315,6 +315,33 @@ def test_bind_correct_connection_id_in_request_body():
     assert bound_ids == {"11111111-1111-1111-1111-111111111111", "22222222-2222-2222-2222-222222222222"}
 
 
+def test_bind_request_body_uses_target_connection_details():
+    """The bindConnection body carries the target connection's details, not the existing binding's."""
+    workspace = _make_workspace("ModelA")
+    captured_bodies = []
+
+    def capture_invoke(method, **kwargs):
+        if method == "POST":
+            captured_bodies.append(kwargs.get("body", {}))
+            return {"status_code": 200}
+        return {"body": {"value": [{"id": "66666666-6666-6666-6666-666666666666", "connectivityType": "OnPremisesGateway", "connectionDetails": {"type": "Web", "path": "old", "extra": "x"}}]}}
+
+    workspace.endpoint.invoke.side_effect = capture_invoke
+
+    connections = _make_connections("11111111-1111-1111-1111-111111111111")
+    bind_semanticmodel_to_connection(workspace, connections, {"ModelA": "11111111-1111-1111-1111-111111111111"})
+
+    assert captured_bodies == [
+        {
+            "connectionBinding": {
+                "id": "11111111-1111-1111-1111-111111111111",
+                "connectivityType": "ShareableCloud",
+                "connectionDetails": {"type": "SQL", "path": "srv"},
+            }
+        }
+    ]
+
+
 def test_bind_list_with_non_string_elements_does_not_raise(caplog):
     """A list containing non-string elements (e.g. dicts) must not raise TypeError.
     Non-string items are filtered by _normalize_connection_ids; valid strings still bind."""
@@ -324,7 +351,9 @@ def test_bind_list_with_non_string_elements_does_not_raise(caplog):
     connections = _make_connections("11111111-1111-1111-1111-111111111111")
     with caplog.at_level("WARNING"):
         # {"id": "bad"} is an unhashable dict — must not cause TypeError
-        bind_semanticmodel_to_connection(workspace, connections, {"ModelA": ["11111111-1111-1111-1111-111111111111", {"id": "bad"}, 42]})
+        bind_semanticmodel_to_connection(
+            workspace, connections, {"ModelA": ["11111111-1111-1111-1111-111111111111", {"id": "bad"}, 42]}
+        )
 
     post_calls = [c for c in workspace.endpoint.invoke.call_args_list if c[1]["method"] == "POST"]
     assert len(post_calls) == 1  # only the valid "11111111-1111-1111-1111-111111111111" is bound